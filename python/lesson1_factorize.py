@@ -0,0 +1,296 @@
+#!/usr/bin/env python3
+"""
+Prime Factorization for the GCD and LCM lesson!
+Break numbers into prime building blocks, then find GCD and LCM from them.
+
+Example: 48 = 2^4 × 3 and 18 = 2 × 3^2
+- GCD takes the SMALLER power of each shared prime: 2^1 × 3^1 = 6
+- LCM takes the BIGGER power of every prime:        2^4 × 3^2 = 144
+
+Usage:
+    python lesson1_factorize.py 48 18
+"""
+
+import argparse
+import mmap
+import os
+import random
+from array import array
+from math import gcd, isqrt
+
+# Numbers up to this are factored with a table lookup; bigger ones use Pollard's rho
+DEFAULT_SIEVE_LIMIT = 1_000_000
+
+_SIEVE_MAGIC = b"SPF1"
+_SIEVE_HEADER_SIZE = 16  # magic (4 bytes) + padding (4) + limit (8, little-endian)
+
+class SmallestPrimeFactorSieve:
+    """
+    A table of the smallest prime factor of every number up to `limit`.
+
+    spf[n] is the smallest prime dividing n (and spf[p] == p for a prime p).
+    To factor n we just keep dividing by spf[n]: no trial division at all.
+
+    The table is an array of 32-bit unsigned ints (4 bytes per number, so
+    40 MB for limit = 10 million). It can be saved to a file and loaded
+    back with mmap, which shares the pages between processes and only
+    reads the parts that are used.
+    """
+
+    def __init__(self, limit, table):
+        self.limit = limit
+        self._table = table
+
+    @classmethod
+    def build(cls, limit):
+        """Build the table with a sieve of Eratosthenes."""
+        if not 1 <= limit < 2**32:
+            raise ValueError(f"Sieve limit must be between 1 and 2**32 - 1, got {limit}")
+        root = isqrt(limit)
+
+        # First find which numbers up to sqrt(limit) are prime
+        is_prime = bytearray([1]) * (root + 1)
+        is_prime[:2] = b"\0\0"[:root + 1]
+        for p in range(2, isqrt(root) + 1):
+            if is_prime[p]:
+                is_prime[p * p::p] = bytes(len(range(p * p, root + 1, p)))
+
+        # Start with spf[n] = n, then mark multiples of each prime from the
+        # biggest prime down, so the smallest prime is written last and wins
+        table = array("I", range(limit + 1))
+        for p in range(root, 1, -1):
+            if is_prime[p]:
+                table[p * p::p] = array("I", [p]) * len(range(p * p, limit + 1, p))
+        return cls(limit, table)
+
+    def save(self, path):
+        """Write the table to a file that load() can memory-map later."""
+        with open(path, "wb") as f:
+            f.write(_SIEVE_MAGIC + bytes(4) + self.limit.to_bytes(8, "little"))
+            self._table.tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map a table written by save() (on a machine with the same byte order)."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = mapped[:_SIEVE_HEADER_SIZE]
+        limit = int.from_bytes(header[8:16], "little")
+        if header[:4] != _SIEVE_MAGIC or len(mapped) != _SIEVE_HEADER_SIZE + 4 * (limit + 1):
+            mapped.close()
+            raise ValueError(f"{path} is not a smallest-prime-factor sieve file")
+        return cls(limit, memoryview(mapped)[_SIEVE_HEADER_SIZE:].cast("I"))
+
+    @classmethod
+    def cached(cls, limit, directory):
+        """Load the sieve for `limit` from `directory`, building and saving it the first time."""
+        path = os.path.join(directory, f"spf_{limit}.bin")
+        try:
+            return cls.load(path)
+        except (FileNotFoundError, ValueError):
+            pass
+        sieve = cls.build(limit)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary name first, so nobody ever maps a half-written file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        sieve.save(temporary)
+        os.replace(temporary, path)
+        return sieve
+
+    def smallest_prime_factor(self, n):
+        """The smallest prime that divides n (for 2 <= n <= limit)."""
+        return self._table[n]
+
+    def factorize(self, n):
+        """Prime factors of 1 <= n <= limit as {prime: exponent}."""
+        factors = {}
+        while n > 1:
+            p = self._table[n]
+            n //= p
+            factors[p] = factors.get(p, 0) + 1
+        return factors
+
+_default_sieve = None
+
+def get_sieve(limit=DEFAULT_SIEVE_LIMIT, cache_dir=None):
+    """
+    The shared sieve used by factorize().
+
+    It is built the first time it's needed (or loaded from cache_dir if
+    given) and then reused. Asking for a bigger limit replaces it.
+    """
+    global _default_sieve
+    if _default_sieve is None or _default_sieve.limit < limit:
+        if cache_dir:
+            _default_sieve = SmallestPrimeFactorSieve.cached(limit, cache_dir)
+        else:
+            _default_sieve = SmallestPrimeFactorSieve.build(limit)
+    return _default_sieve
+
+# ============================================================================
+# BIG NUMBERS: Miller-Rabin primality test and Pollard's rho
+# ============================================================================
+
+# With these bases Miller-Rabin never lies for n < 3.3 * 10**24; above that
+# a composite passing all of them is astronomically unlikely
+_MILLER_RABIN_BASES = (2, 3, 5, 7, 11, 13, 17, 19, 23, 29, 31, 37, 41)
+
+def is_probable_prime(n):
+    """Miller-Rabin primality test."""
+    if n < 2:
+        return False
+    for p in _MILLER_RABIN_BASES:
+        if n % p == 0:
+            return n == p
+    d, s = n - 1, 0
+    while d % 2 == 0:
+        d, s = d // 2, s + 1
+    for a in _MILLER_RABIN_BASES:
+        x = pow(a, d, n)
+        if x in (1, n - 1):
+            continue
+        for _ in range(s - 1):
+            x = x * x % n
+            if x == n - 1:
+                break
+        else:
+            return False
+    return True
+
+def pollard_rho(n, rng=random):
+    """
+    Find some factor 1 < d < n of a composite n (Brent's version of Pollard's rho).
+
+    The sequence x -> x*x + c (mod n) eventually repeats. Modulo an unknown
+    prime p of n it repeats much sooner (after about sqrt(p) steps), and we
+    notice that when GCD(difference of two values, n) is bigger than 1.
+    Differences are multiplied together in groups of 128 so we only need
+    one GCD per group.
+    """
+    if n % 2 == 0:
+        return 2
+    while True:
+        y, c, m = rng.randrange(1, n), rng.randrange(1, n), 128
+        g = r = q = 1
+        while g == 1:
+            x = y
+            for _ in range(r):
+                y = (y * y + c) % n
+            k = 0
+            while k < r and g == 1:
+                saved = y
+                for _ in range(min(m, r - k)):
+                    y = (y * y + c) % n
+                    q = q * abs(x - y) % n
+                g = gcd(q, n)
+                k += m
+            r *= 2
+        if g == n:
+            # The group overshot; redo it one step at a time
+            g = 1
+            while g == 1:
+                saved = (saved * saved + c) % n
+                g = gcd(abs(x - saved), n)
+        if g != n:
+            return g
+
+def factorize(n, sieve=None):
+    """
+    Prime factors of a positive whole number as {prime: exponent}.
+
+    Example: factorize(48) -> {2: 4, 3: 1} because 48 = 2^4 × 3
+
+    Small numbers (and small pieces of big ones) come straight from the
+    sieve table. Bigger pieces are split by Pollard's rho until every
+    piece is prime.
+    """
+    if n < 1:
+        raise ValueError(f"Can only factor positive numbers, got {n}")
+    sieve = sieve or get_sieve()
+    factors = {}
+
+    def add(prime, count=1):
+        factors[prime] = factors.get(prime, 0) + count
+
+    # Take out tiny primes first, which is cheap and makes rho's job easier
+    for p in (2, 3, 5, 7, 11, 13):
+        while n % p == 0:
+            n //= p
+            add(p)
+
+    pieces = [n] if n > 1 else []
+    while pieces:
+        piece = pieces.pop()
+        if piece <= sieve.limit:
+            for p, e in sieve.factorize(piece).items():
+                add(p, e)
+        elif is_probable_prime(piece):
+            add(piece)
+        else:
+            d = pollard_rho(piece)
+            pieces += [d, piece // d]
+    return dict(sorted(factors.items()))
+
+# ============================================================================
+# GCD AND LCM FROM FACTORS
+# ============================================================================
+
+def number_from_factors(factors):
+    """Multiply the primes back together: {2: 4, 3: 1} -> 48."""
+    result = 1
+    for p, e in factors.items():
+        result *= p ** e
+    return result
+
+def gcd_from_factors(*factorizations):
+    """Shared primes with the SMALLEST exponent: the GCD, as {prime: exponent}."""
+    if not factorizations:
+        return {}
+    common = set(factorizations[0]).intersection(*factorizations[1:])
+    return {p: min(f[p] for f in factorizations) for p in sorted(common)}
+
+def lcm_from_factors(*factorizations):
+    """Every prime with the BIGGEST exponent: the LCM, as {prime: exponent}."""
+    result = {}
+    for factors in factorizations:
+        for p, e in factors.items():
+            if e > result.get(p, 0):
+                result[p] = e
+    return dict(sorted(result.items()))
+
+def format_factors(factors):
+    """{2: 4, 3: 1} -> "2^4 × 3" (and {} -> "1")."""
+    if not factors:
+        return "1"
+    return " × ".join(str(p) if e == 1 else f"{p}^{e}" for p, e in factors.items())
+
+def explain_gcd_lcm(*numbers):
+    """Show the prime factorization way to find the GCD and LCM, step by step."""
+    factorizations = [factorize(n) for n in numbers]
+    lines = [f"{n} = {format_factors(f)}" for n, f in zip(numbers, factorizations)]
+    gcd_factors = gcd_from_factors(*factorizations)
+    lcm_factors = lcm_from_factors(*factorizations)
+    lines.append(f"GCD = {format_factors(gcd_factors)} = {number_from_factors(gcd_factors)}"
+                 "  (smallest power of each shared prime)")
+    lines.append(f"LCM = {format_factors(lcm_factors)} = {number_from_factors(lcm_factors)}"
+                 "  (biggest power of every prime)")
+    return "\n".join(lines)
+
+def _positive_int(text):
+    """argparse type: a whole number of at least 1 (0 and negatives have no prime factors)."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a whole number")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"need a positive whole number, got {value}")
+    return value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Find the GCD and LCM from prime factors")
+    parser.add_argument("numbers", nargs="+", type=_positive_int, metavar="NUMBER")
+    args = parser.parse_args(argv)
+    print(explain_gcd_lcm(*args.numbers))
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,352 @@
+#!/usr/bin/env python3
+"""
+Millions of fractions at once, always in lowest terms!
+
+A fraction is in lowest terms when the GCD of its top and bottom is 1:
+6/8 -> divide both by GCD(6, 8) = 2 -> 3/4. FractionArray keeps all the
+numerators in one NumPy array and all the denominators in another, and
+reduces them all together with find_gcd_batch.
+
+Example:
+    halves = FractionArray([1, 1, 1], [2, 4, 8])    # 1/2, 1/4, 1/8
+    print(halves + FractionArray([1, 3, 5], [3, 4, 8]))  # [5/6, 1, 3/4]
+
+Usage:
+    python lesson1_fractions.py --count 1000000   # speed and memory vs fractions.Fraction
+
+Needs NumPy (pip install numpy).
+"""
+
+import argparse
+import random
+import time
+import tracemalloc
+from fractions import Fraction
+
+import numpy as np
+
+from lesson1_gcd_lcm import INT64_MAX, INT64_MIN, as_int_array, find_gcd_batch, find_lcm_batch
+
+def _int_array(values):
+    """values as a 1-D int64 array, or an object array of Python ints if they don't fit."""
+    arr = np.atleast_1d(as_int_array(values))
+    if arr.ndim != 1:
+        raise ValueError(f"FractionArray is one-dimensional, got shape {arr.shape}")
+    if arr.size == 0:
+        return np.zeros(0, dtype=np.int64)
+    if arr.dtype.kind not in "biuO":
+        raise TypeError(f"Fractions need whole numbers, got an array of {arr.dtype}")
+    if arr.dtype.kind == "O":
+        ints = [int(v) for v in arr]
+        if all(INT64_MIN < v <= INT64_MAX for v in ints):
+            return np.array(ints, dtype=np.int64)
+        return np.array(ints, dtype=object)
+    if arr.dtype.kind == "u" and int(arr.max()) > INT64_MAX:
+        return np.array([int(v) for v in arr], dtype=object)
+    arr = arr.astype(np.int64)
+    # -2**63 has no int64 opposite, so flipping signs would wrap around
+    if (arr == INT64_MIN).any():
+        return arr.astype(object)
+    return arr
+
+def _shrink(*arrays):
+    """Turn object arrays back into int64 if every value in all of them fits."""
+    if all(arr.dtype != object for arr in arrays):
+        return arrays
+    for arr in arrays:
+        if arr.size and not all(INT64_MIN < v <= INT64_MAX for v in arr.tolist()):
+            return tuple(arr.astype(object) for arr in arrays)
+    return tuple(arr.astype(np.int64) for arr in arrays)
+
+def _multiply(a, b):
+    """a * b, switching to Python ints where int64 would overflow."""
+    if a.dtype == object or b.dtype == object:
+        return a.astype(object) * b.astype(object)
+    abs_a, abs_b = np.abs(a), np.abs(b)
+    # abs(INT64_MIN) stays negative, which the first test catches
+    if (abs_a >= 0).all() and (abs_b >= 0).all():
+        safe = (abs_b == 0) | (abs_a <= INT64_MAX // np.maximum(abs_b, 1))
+        if safe.all():
+            return a * b
+    return a.astype(object) * b.astype(object)
+
+def _add(a, b):
+    """a + b, switching to Python ints where int64 would overflow."""
+    if a.dtype == object or b.dtype == object:
+        return a.astype(object) + b.astype(object)
+    with np.errstate(over="ignore"):
+        total = a + b
+    # Adding two numbers with the same sign can't flip the sign unless it overflowed
+    if (((a ^ total) & (b ^ total)) < 0).any():
+        return a.astype(object) + b.astype(object)
+    return total
+
+class FractionArray:
+    """
+    A list of fractions stored as two arrays: numerators and denominators.
+
+    Every fraction is kept in lowest terms with a positive denominator,
+    so 6/-8 is stored as -3/4. The arrays are int64 (16 bytes per
+    fraction) while the numbers fit, and switch to Python ints (never
+    losing digits) when they don't.
+
+    +, -, *, / and the comparisons work element by element, with another
+    FractionArray of the same length, a whole number or a Fraction.
+    Comparisons give NumPy arrays of True/False.
+    """
+
+    __slots__ = ("numerators", "denominators")
+
+    def __init__(self, numerators, denominators=1, normalize=True):
+        n = _int_array(numerators)
+        d = _int_array(denominators)
+        n, d = np.broadcast_arrays(n, d)
+        n, d = n.copy(), d.copy()
+        if (n.dtype == object) != (d.dtype == object):
+            n, d = n.astype(object), d.astype(object)
+        if normalize:
+            n, d = self._normalize(n, d)
+        self.numerators = n
+        self.denominators = d
+
+    @staticmethod
+    def _normalize(n, d):
+        """Lowest terms with positive denominators, all in one go."""
+        if (d == 0).any():
+            raise ZeroDivisionError("A fraction can't have 0 as its denominator")
+        g = find_gcd_batch(n, d)
+        if g.dtype == object and n.dtype != object:
+            n, d = n.astype(object), d.astype(object)
+        n, d = n // g, d // g
+        negative = d < 0
+        if negative.any():
+            n = np.where(negative, -n, n)
+            d = np.where(negative, -d, d)
+        return _shrink(n, d)
+
+    @classmethod
+    def _reduced(cls, n, d):
+        """Wrap arrays that are already in lowest terms, without checking again."""
+        result = cls.__new__(cls)
+        result.numerators, result.denominators = _shrink(n, d)
+        return result
+
+    @classmethod
+    def from_fractions(cls, fractions):
+        """Make a FractionArray from Fractions (or whole numbers)."""
+        fractions = [Fraction(f) for f in fractions]
+        return cls._reduced(_int_array([f.numerator for f in fractions]),
+                            _int_array([f.denominator for f in fractions]))
+
+    def _coerce(self, other):
+        if isinstance(other, FractionArray):
+            return other
+        if isinstance(other, (int, np.integer)):
+            return FractionArray._reduced(_int_array([other]), np.ones(1, dtype=np.int64))
+        if isinstance(other, Fraction):
+            return FractionArray._reduced(_int_array([other.numerator]), _int_array([other.denominator]))
+        return NotImplemented
+
+    # ---- arithmetic ------------------------------------------------------
+
+    def __add__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        # Use the LCM of the denominators, like we do by hand:
+        # 1/4 + 1/6 = 3/12 + 2/12 = 5/12
+        common = find_lcm_batch(self.denominators, other.denominators, on_overflow="object")
+        left = _multiply(self.numerators, common // self.denominators)
+        right = _multiply(other.numerators, common // other.denominators)
+        n, d = np.broadcast_arrays(_add(left, right), common)
+        return FractionArray(n, d)
+
+    __radd__ = __add__
+
+    def __neg__(self):
+        return FractionArray._reduced(-self.numerators, self.denominators.copy())
+
+    def __sub__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return self + (-other)
+
+    def __rsub__(self, other):
+        return -self + other
+
+    def __mul__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        # Cancel across first (2/3 × 9/4: 2 with 4 and 9 with 3), so the
+        # products are already in lowest terms and stay small
+        g1 = find_gcd_batch(self.numerators, other.denominators)
+        g2 = find_gcd_batch(other.numerators, self.denominators)
+        g1 = np.where(g1 == 0, 1, g1)  # only when a numerator is 0
+        g2 = np.where(g2 == 0, 1, g2)
+        n = _multiply(self.numerators // g1, other.numerators // g2)
+        d = _multiply(self.denominators // g2, other.denominators // g1)
+        return FractionArray._reduced(*np.broadcast_arrays(n, d))
+
+    __rmul__ = __mul__
+
+    def reciprocal(self):
+        """1 / each fraction (3/4 -> 4/3)."""
+        if (self.numerators == 0).any():
+            raise ZeroDivisionError("0 has no reciprocal")
+        negative = self.numerators < 0
+        return FractionArray._reduced(np.where(negative, -self.denominators, self.denominators),
+                                      np.where(negative, -self.numerators, self.numerators))
+
+    def __truediv__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        return self * other.reciprocal()
+
+    def __rtruediv__(self, other):
+        return self.reciprocal() * other
+
+    # ---- comparisons -----------------------------------------------------
+
+    def _cross(self, other):
+        """(a*d, c*b) for a/b vs c/d; the denominators are positive, so these compare the same way."""
+        return (_multiply(self.numerators, other.denominators),
+                _multiply(other.numerators, self.denominators))
+
+    def __eq__(self, other):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        # Lowest terms are unique, so no multiplying is needed
+        return (self.numerators == other.numerators) & (self.denominators == other.denominators)
+
+    def __ne__(self, other):
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else ~equal
+
+    def _compare(self, other, op):
+        other = self._coerce(other)
+        if other is NotImplemented:
+            return other
+        left, right = self._cross(other)
+        return op(left, right).astype(bool)
+
+    def __lt__(self, other):
+        return self._compare(other, np.less)
+
+    def __le__(self, other):
+        return self._compare(other, np.less_equal)
+
+    def __gt__(self, other):
+        return self._compare(other, np.greater)
+
+    def __ge__(self, other):
+        return self._compare(other, np.greater_equal)
+
+    __hash__ = None
+
+    # ---- everything else -------------------------------------------------
+
+    def sum(self):
+        """All the fractions added together, as a Fraction."""
+        total = self
+        # Add the two halves together until one fraction is left, so every
+        # step is one vectorized addition
+        while len(total) > 1:
+            if len(total) % 2:
+                total = FractionArray._reduced(np.append(total.numerators, 0),
+                                               np.append(total.denominators, 1))
+            half = len(total) // 2
+            total = total[:half] + total[half:]
+        return total[0] if len(total) else Fraction(0)
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __getitem__(self, index):
+        if isinstance(index, (int, np.integer)):
+            return Fraction(int(self.numerators[index]), int(self.denominators[index]))
+        return FractionArray._reduced(self.numerators[index], self.denominators[index])
+
+    def __iter__(self):
+        return iter(self.to_fractions())
+
+    def to_fractions(self):
+        """A list of fractions.Fraction."""
+        return [Fraction(n, d) for n, d in zip(self.numerators.tolist(), self.denominators.tolist())]
+
+    def to_floats(self):
+        """The fractions as decimals (a float64 array)."""
+        if self.numerators.dtype == object:
+            return np.array([n / d for n, d in zip(self.numerators.tolist(), self.denominators.tolist())])
+        return self.numerators / self.denominators
+
+    @property
+    def nbytes(self):
+        """Memory used by the two arrays (not counting Python ints in object arrays)."""
+        return self.numerators.nbytes + self.denominators.nbytes
+
+    def __repr__(self):
+        shown = [str(f) for f in self.to_fractions()[:10]]
+        if len(self) > 10:
+            shown.append(f"... ({len(self)} fractions)")
+        return f"FractionArray([{', '.join(shown)}])"
+
+# ============================================================================
+# SPEED AND MEMORY vs fractions.Fraction
+# ============================================================================
+
+def _timed(func):
+    start = time.perf_counter()
+    result = func()
+    return time.perf_counter() - start, result
+
+def _stored_bytes(func):
+    """Memory still used by what func() returns (measured with tracemalloc)."""
+    tracemalloc.start()
+    try:
+        result = func()
+        return tracemalloc.get_traced_memory()[0], result
+    finally:
+        tracemalloc.stop()
+
+def compare_with_fraction(count, seed=2024):
+    """Reduce, add, multiply and compare `count` random fractions both ways and print the times."""
+    rng = random.Random(seed)
+    tops = [rng.randint(1, 10**6) for _ in range(2 * count)]
+    bottoms = [rng.randint(1, 10**6) for _ in range(2 * count)]
+
+    print(f"{'':>10} {'Fraction list':>14} {'FractionArray':>14} {'faster':>8}")
+    slow_seconds, fractions = _timed(lambda: [Fraction(n, d) for n, d in zip(tops, bottoms)])
+    fast_seconds, array = _timed(lambda: FractionArray(tops, bottoms))
+    assert array.to_fractions() == fractions
+    _print_row("reduce", slow_seconds, fast_seconds)
+
+    left, right = fractions[:count], fractions[count:]
+    left_array, right_array = array[:count], array[count:]
+    for name, slow, fast in (
+        ("add", lambda: [a + b for a, b in zip(left, right)], lambda: left_array + right_array),
+        ("multiply", lambda: [a * b for a, b in zip(left, right)], lambda: left_array * right_array),
+        ("compare", lambda: [a < b for a, b in zip(left, right)], lambda: left_array < right_array),
+    ):
+        slow_seconds, expected = _timed(slow)
+        fast_seconds, got = _timed(fast)
+        assert (list(got) if name == "compare" else got.to_fractions()) == expected
+        _print_row(name, slow_seconds, fast_seconds)
+
+    # Each Fraction is a Python object holding two more Python objects;
+    # FractionArray stores two 8-byte numbers per fraction
+    slow_bytes, _ = _stored_bytes(lambda: [Fraction(n, d) for n, d in zip(tops, bottoms)])
+    fast_bytes, _ = _stored_bytes(lambda: FractionArray(tops, bottoms))
+    print(f"\n{'memory':>10} {slow_bytes / 2**20:>11.1f} MB {fast_bytes / 2**20:>11.1f} MB "
+          f"{slow_bytes / fast_bytes:>7.1f}x smaller ({2 * count} fractions)")
+
+def _print_row(name, slow_seconds, fast_seconds):
+    print(f"{name:>10} {slow_seconds:>13.3f}s {fast_seconds:>13.3f}s {slow_seconds / fast_seconds:>7.1f}x")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="FractionArray vs a list of fractions.Fraction")
+    parser.add_argument("--count", type=int, default=1_000_000, help="fractions per side")
+    compare_with_fraction(parser.parse_args().count)
@@ -0,0 +1,474 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the GCD and LCM lesson.
+How fast are our GCD functions? Let's measure them instead of guessing!
+
+Usage:
+    python lesson1_gcd_bench.py crossover      # where does Lehmer beat Euclid?
+    python lesson1_gcd_bench.py suite -o before.json
+    python lesson1_gcd_bench.py suite -o after.json
+    python lesson1_gcd_bench.py compare before.json after.json
+    python lesson1_gcd_bench.py lcm            # divide-first LCM vs (a*b)//gcd
+    python lesson1_gcd_bench.py startup        # is `lesson1_run.py compute 48 18` as quick as bare Python?
+"""
+
+import argparse
+import json
+import math
+import os
+import platform
+import random
+import statistics
+import subprocess
+import sys
+import time
+import timeit
+import tracemalloc
+
+from lesson1_gcd_lcm import GCD_ALGORITHMS, LEHMER_MIN_BITS, find_gcd, find_lcm
+
+# Operand sizes (in bits) for the crossover table: powers of two and the
+# halfway points between them, so the crossover is found to within ~25%
+CROSSOVER_BITS = [64, 128, 256, 512, 768, 1024, 1536, 2048, 3072,
+                  4096, 6144, 8192, 12288, 16384, 24576, 32768]
+
+def random_pair(bits, rng):
+    """Two random numbers with exactly `bits` bits each."""
+    top = 1 << (bits - 1)
+    return rng.getrandbits(bits) | top, rng.getrandbits(bits) | top
+
+def time_per_call(func, pairs, repeat=3):
+    """Best-of-`repeat` time in seconds for one func(a, b) call."""
+    def run():
+        for a, b in pairs:
+            func(a, b)
+    return min(timeit.repeat(run, number=1, repeat=repeat)) / len(pairs)
+
+def measure_crossover(bit_sizes=CROSSOVER_BITS, pairs_per_size=20, repeat=3, seed=2024):
+    """
+    Time every GCD algorithm at every operand size.
+
+    Returns a list of rows like {"bits": 1024, "euclid": 1.1e-4, ...}
+    with the seconds per call for each algorithm.
+    """
+    rng = random.Random(seed)
+    rows = []
+    for bits in bit_sizes:
+        pairs = [random_pair(bits, rng) for _ in range(pairs_per_size)]
+        row = {"bits": bits}
+        for name, func in GCD_ALGORITHMS.items():
+            row[name] = time_per_call(func, pairs, repeat)
+        rows.append(row)
+    return rows
+
+def find_crossover(rows, slow="euclid", fast="lehmer"):
+    """
+    Smallest size from which `fast` stays faster than `slow` for every
+    bigger size in the table, or None if it never does.
+    """
+    crossover = None
+    for row in reversed(rows):
+        if row[fast] >= row[slow]:
+            break
+        crossover = row["bits"]
+    return crossover
+
+def print_crossover(rows):
+    """Print the timing table and the measured crossover points."""
+    names = list(GCD_ALGORITHMS)
+    print(f"{'bits':>8} " + " ".join(f"{name:>12}" for name in names) + "   fastest")
+    for row in rows:
+        fastest = min(("euclid", "binary", "lehmer"), key=row.get)
+        cells = " ".join(f"{row[name] * 1e6:>10.1f}us" for name in names)
+        print(f"{row['bits']:>8} {cells}   {fastest}")
+    print()
+    for fast in ("lehmer", "binary"):
+        bits = find_crossover(rows, fast=fast)
+        if bits is None:
+            print(f"{fast} never beats euclid in this range")
+        else:
+            print(f"{fast} beats euclid from about {bits} bits")
+    print(f"auto currently switches to lehmer at LEHMER_MIN_BITS = {LEHMER_MIN_BITS}")
+
+# ============================================================================
+# BENCHMARK SUITE (sizes x distributions x batch sizes, saved as JSON)
+# ============================================================================
+
+# Operand size name -> bits per number
+SUITE_SIZES = {"small": 16, "64bit": 64, "1kbit": 1024, "100kbit": 100_000}
+
+# How many calls make up one timed run, so each run takes roughly the same time
+SUITE_OPS = {"small": 20_000, "64bit": 5_000, "1kbit": 500, "100kbit": 1}
+
+# coprime:   random numbers with GCD 1
+# fibonacci: consecutive Fibonacci numbers, the worst case for Euclid
+# shared:    both numbers are multiples of the same random half-size factor
+SUITE_DISTRIBUTIONS = ("coprime", "fibonacci", "shared")
+
+# Pairs per call for the NumPy batch functions (sizes that fit in int64 only)
+SUITE_BATCH_SIZES = (1_000, 100_000)
+BATCH_MAX_BITS = 63
+
+def fibonacci_pair(bits):
+    """The biggest consecutive Fibonacci numbers with at most `bits` bits."""
+    a, b = 1, 2
+    while (a + b).bit_length() <= bits:
+        a, b = b, a + b
+    return b, a
+
+def make_pairs(distribution, bits, count, rng):
+    """`count` pairs of `bits`-bit numbers following one of SUITE_DISTRIBUTIONS."""
+    if distribution == "fibonacci":
+        return [fibonacci_pair(bits)] * count
+    pairs = []
+    while len(pairs) < count:
+        if distribution == "coprime":
+            a, b = random_pair(bits, rng)
+            if math.gcd(a, b) == 1:
+                pairs.append((a, b))
+        elif distribution == "shared":
+            factor_bits = max(bits // 2, 1)
+            factor = rng.getrandbits(factor_bits) | (1 << (factor_bits - 1))
+            a, b = random_pair(max(bits - factor_bits, 1), rng)
+            pairs.append((a * factor, b * factor))
+        else:
+            raise ValueError(f"Unknown distribution {distribution!r}")
+    return pairs
+
+def time_runs(run, warmup=1, repeat=5):
+    """Call run() `warmup` times untimed, then return `repeat` timings in seconds."""
+    for _ in range(warmup):
+        run()
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def summarize(timings, ops):
+    """Turn per-run timings into ns/op statistics and ops/s."""
+    per_op = [t / ops * 1e9 for t in timings]
+    median = statistics.median(per_op)
+    return {
+        "ops": ops,
+        "repeat": len(timings),
+        "min_ns": min(per_op),
+        "median_ns": median,
+        "mean_ns": statistics.mean(per_op),
+        "stdev_ns": statistics.stdev(per_op) if len(per_op) > 1 else 0.0,
+        "ops_per_sec": 1e9 / median if median else float("inf"),
+    }
+
+def scalar_cases(sizes, distributions, rng):
+    """(name, size, distribution, batch, run, ops) for find_gcd and find_lcm."""
+    for size in sizes:
+        bits = SUITE_SIZES[size]
+        for distribution in distributions:
+            pairs = make_pairs(distribution, bits, SUITE_OPS[size], rng)
+            for func in (find_gcd, find_lcm):
+                def run(func=func, pairs=pairs):
+                    for a, b in pairs:
+                        func(a, b)
+                yield func.__name__, size, distribution, 1, run, len(pairs)
+
+def batch_cases(sizes, distributions, batch_sizes, rng):
+    """The same cases for find_gcd_batch and find_lcm_batch, if NumPy is installed."""
+    try:
+        import numpy as np
+    except ImportError:
+        print("(NumPy not installed, skipping batch benchmarks)", file=sys.stderr)
+        return
+    from lesson1_gcd_lcm import find_gcd_batch, find_lcm_batch
+
+    for size in sizes:
+        bits = SUITE_SIZES[size]
+        if bits > BATCH_MAX_BITS + 1:
+            continue
+        for distribution in distributions:
+            for batch in batch_sizes:
+                pairs = make_pairs(distribution, min(bits, BATCH_MAX_BITS), batch, rng)
+                a = np.array([p[0] for p in pairs], dtype=np.int64)
+                b = np.array([p[1] for p in pairs], dtype=np.int64)
+                yield "find_gcd_batch", size, distribution, batch, lambda a=a, b=b: find_gcd_batch(a, b), batch
+                yield ("find_lcm_batch", size, distribution, batch,
+                       lambda a=a, b=b: find_lcm_batch(a, b, on_overflow="object"), batch)
+
+def run_suite(sizes=tuple(SUITE_SIZES), distributions=SUITE_DISTRIBUTIONS,
+              batch_sizes=SUITE_BATCH_SIZES, warmup=1, repeat=5, seed=2024, progress=None):
+    """
+    Time every case and return a JSON-ready dict with "meta" and "results".
+
+    Each result has the function, size, bits, distribution and batch size
+    plus the statistics from summarize(). `progress`, if given, is called
+    with each result as soon as it is measured.
+    """
+    rng = random.Random(seed)
+    results = []
+    cases = [*scalar_cases(sizes, distributions, rng),
+             *batch_cases(sizes, distributions, batch_sizes, rng)]
+    for name, size, distribution, batch, run, ops in cases:
+        result = {"function": name, "size": size, "bits": SUITE_SIZES[size],
+                  "distribution": distribution, "batch": batch}
+        result.update(summarize(time_runs(run, warmup, repeat), ops))
+        results.append(result)
+        if progress:
+            progress(result)
+    return {
+        "meta": {
+            "python": platform.python_version(),
+            "implementation": platform.python_implementation(),
+            "machine": platform.machine(),
+            "platform": platform.platform(),
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+            "warmup": warmup,
+            "repeat": repeat,
+            "seed": seed,
+        },
+        "results": results,
+    }
+
+def print_result(result):
+    """One line of the results table."""
+    print(f"{result['function']:>15} {result['size']:>8} {result['distribution']:>10} "
+          f"{result['batch']:>7} {result['median_ns']:>14,.0f} ns/op "
+          f"±{result['stdev_ns']:>10,.0f} {result['ops_per_sec']:>14,.1f} ops/s")
+
+def case_key(result):
+    """What identifies the same benchmark case across two runs."""
+    return result["function"], result["size"], result["distribution"], result["batch"]
+
+def compare_results(old, new):
+    """
+    Compare two suite results (dicts loaded from JSON).
+
+    Returns a list of (case, old_ns, new_ns, change) for every case present
+    in both runs, where change is the relative change in median ns/op
+    (+0.25 means 25% slower).
+    """
+    old_by_case = {case_key(r): r for r in old["results"]}
+    rows = []
+    for result in new["results"]:
+        before = old_by_case.get(case_key(result))
+        if before is None:
+            continue
+        change = result["median_ns"] / before["median_ns"] - 1
+        rows.append((case_key(result), before["median_ns"], result["median_ns"], change))
+    return rows
+
+def print_comparison(rows, threshold):
+    """Print the comparison table and return how many cases regressed."""
+    regressions = 0
+    for (name, size, distribution, batch), old_ns, new_ns, change in rows:
+        flag = ""
+        if change > threshold:
+            flag = "  ❌ REGRESSION"
+            regressions += 1
+        elif change < -threshold:
+            flag = "  ✅ faster"
+        print(f"{name:>15} {size:>8} {distribution:>10} {batch:>7} "
+              f"{old_ns:>14,.0f} -> {new_ns:>14,.0f} ns/op {change:>+8.1%}{flag}")
+    print(f"\n{regressions} of {len(rows)} cases slower by more than {threshold:.0%}")
+    return regressions
+
+# ============================================================================
+# LCM: DIVIDE FIRST vs MULTIPLY FIRST
+# ============================================================================
+
+LCM_BENCH_BITS = (10_000, 100_000, 1_000_000)
+
+def peak_memory(func):
+    """Peak bytes allocated while func() runs (including its result)."""
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1]
+    finally:
+        tracemalloc.stop()
+
+def measure_lcm_step(bits, repeat=3, seed=2024):
+    """
+    Compare the two ways of turning a GCD into an LCM on `bits`-bit numbers.
+
+    The numbers share a random factor half their size, so the GCD is big,
+    like denominators that have a lot in common. The GCD is computed once
+    up front (with math.gcd) so only the LCM step itself is measured.
+    Returns {"bits": .., "product first": (seconds, bytes), "divide first": (..)}.
+    """
+    rng = random.Random(seed)
+    a, b = make_pairs("shared", bits, 1, rng)[0]
+    g = math.gcd(a, b)
+    steps = {
+        "product first": lambda: (a * b) // g,
+        "divide first": lambda: a // g * b,
+    }
+    row = {"bits": bits}
+    for name, step in steps.items():
+        seconds = min(timeit.repeat(step, number=1, repeat=repeat))
+        row[name] = (seconds, peak_memory(step))
+    return row
+
+def print_lcm_comparison(rows):
+    """Print time and peak memory of both LCM formulas, and how much we save."""
+    print(f"{'bits':>10} {'(a*b)//g':>22} {'a//g*b':>22} {'time saved':>11} {'memory saved':>13}")
+    for row in rows:
+        old_seconds, old_bytes = row["product first"]
+        new_seconds, new_bytes = row["divide first"]
+        print(f"{row['bits']:>10,} {old_seconds * 1e3:>9.2f}ms {old_bytes / 1024:>8,.0f}KiB "
+              f"{new_seconds * 1e3:>9.2f}ms {new_bytes / 1024:>8,.0f}KiB "
+              f"{1 - new_seconds / old_seconds:>10.0%} {1 - new_bytes / old_bytes:>12.0%}")
+
+# ============================================================================
+# STARTUP TIME: how long until `compute 48 18` has printed its answer?
+# ============================================================================
+
+LESSON_DIR = os.path.dirname(os.path.abspath(__file__))
+
+# What we time: starting Python and doing nothing, importing the lesson
+# module, and a one-shot answer, through the lesson1_run.py launcher and
+# by running lesson1_gcd_lcm.py directly. Python compiles a file it runs
+# directly every time (only imported modules are cached in __pycache__),
+# so "script" minus "compute" is the cost of that compile.
+STARTUP_COMMANDS = {
+    "bare": ["-c", "pass"],
+    "import": ["-c", "import lesson1_gcd_lcm"],
+    "compute": ["lesson1_run.py", "compute", "48", "18"],
+    "script": ["lesson1_gcd_lcm.py", "compute", "48", "18"],
+}
+
+def _startup_env():
+    """Our environment, but always letting Python save compiled modules, like a normal setup."""
+    env = dict(os.environ)
+    env.pop("PYTHONDONTWRITEBYTECODE", None)
+    return env
+
+def time_startup(args, runs=20):
+    """Wall-clock seconds of `runs` fresh `python <args>` processes (run in the lesson folder)."""
+    command = [sys.executable, *args]
+    env = _startup_env()
+    # One untimed run first, so __pycache__ is filled in
+    subprocess.run(command, stdout=subprocess.DEVNULL, check=True, cwd=LESSON_DIR, env=env)
+    timings = []
+    for _ in range(runs):
+        start = time.perf_counter()
+        subprocess.run(command, stdout=subprocess.DEVNULL, check=True, cwd=LESSON_DIR, env=env)
+        timings.append(time.perf_counter() - start)
+    return timings
+
+def import_times(args):
+    """
+    Run `python -X importtime <args>` and return what it imported.
+
+    Returns a list of (module, self microseconds, cumulative microseconds,
+    depth), in import order; depth 0 means imported directly, not by
+    another module.
+    """
+    finished = subprocess.run([sys.executable, "-X", "importtime", *args],
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True, check=True,
+                              cwd=LESSON_DIR, env=_startup_env())
+    modules = []
+    for line in finished.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        fields = line[len("import time:"):].split("|")
+        if len(fields) != 3 or not fields[0].strip().isdigit():
+            continue  # the header line
+        name = fields[2].rstrip()
+        depth = (len(name) - len(name.lstrip())) // 2 - 1
+        modules.append((name.strip(), int(fields[0]), int(fields[1]), depth))
+    return modules
+
+def extra_imports(args, baseline="bare"):
+    """Modules `python <args>` imports that the `baseline` command doesn't, slowest first."""
+    already = {name for name, *_ in import_times(STARTUP_COMMANDS[baseline])}
+    extra = [m for m in import_times(args) if m[0] not in already]
+    return sorted(extra, key=lambda m: m[2], reverse=True)
+
+def startup_cases(runs):
+    """Suite results for every STARTUP_COMMANDS entry (one op = one process)."""
+    for name, args in STARTUP_COMMANDS.items():
+        result = {"function": "startup", "size": "-", "bits": 0, "distribution": name, "batch": 1}
+        result.update(summarize(time_startup(args, runs), 1))
+        yield result
+
+def print_startup(runs=20, top=15):
+    """Compare startup times and list the imports that cost extra."""
+    medians = {}
+    for name, args in STARTUP_COMMANDS.items():
+        medians[name] = statistics.median(time_startup(args, runs))
+        print(f"{name:>10}: {medians[name] * 1e3:7.1f} ms")
+    bare = medians.pop("bare")
+    for name, median in medians.items():
+        print(f"{name:>10} costs {(median - bare) * 1e3:+.1f} ms over bare Python")
+
+    extra = extra_imports(STARTUP_COMMANDS["compute"])
+    if not extra:
+        print("\n✅ compute imports nothing that bare Python doesn't")
+        return
+    print("\nimports beyond bare Python (-X importtime, slowest first):")
+    print(f"{'cumulative':>12} {'self':>9}  module")
+    for name, self_us, cumulative_us, depth in extra[:top]:
+        print(f"{cumulative_us:>10,}us {self_us:>7,}us  {'  ' * depth}{name}")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    crossover = commands.add_parser("crossover", help="compare GCD algorithms by operand size")
+    crossover.add_argument("--pairs", type=int, default=20, help="random pairs per size")
+    crossover.add_argument("--repeat", type=int, default=3, help="timing repeats (best is kept)")
+
+    suite = commands.add_parser("suite", help="time find_gcd/find_lcm across sizes and distributions")
+    suite.add_argument("-o", "--output", help="save the results as JSON")
+    suite.add_argument("--sizes", nargs="+", choices=list(SUITE_SIZES), default=list(SUITE_SIZES))
+    suite.add_argument("--distributions", nargs="+", choices=SUITE_DISTRIBUTIONS,
+                       default=list(SUITE_DISTRIBUTIONS))
+    suite.add_argument("--batch-sizes", nargs="*", type=int, default=list(SUITE_BATCH_SIZES))
+    suite.add_argument("--warmup", type=int, default=1, help="untimed runs before timing")
+    suite.add_argument("--repeat", type=int, default=5, help="timed runs per case")
+    suite.add_argument("--seed", type=int, default=2024)
+    suite.add_argument("--startup-runs", type=int, default=10,
+                       help="processes started per startup case, 0 to skip (default: 10)")
+
+    compare = commands.add_parser("compare", help="compare two saved suite runs")
+    compare.add_argument("old", help="JSON from the earlier run")
+    compare.add_argument("new", help="JSON from the later run")
+    compare.add_argument("--threshold", type=float, default=0.10,
+                         help="slowdown that counts as a regression (default: 0.10 = 10%%)")
+
+    lcm = commands.add_parser("lcm", help="compare divide-first LCM with (a*b)//gcd on huge numbers")
+    lcm.add_argument("--bits", nargs="+", type=int, default=list(LCM_BENCH_BITS))
+    lcm.add_argument("--repeat", type=int, default=3, help="timing repeats (best is kept)")
+
+    startup = commands.add_parser("startup", help="time `lesson1_run.py compute` against bare Python")
+    startup.add_argument("--runs", type=int, default=20, help="processes started per command")
+    startup.add_argument("--top", type=int, default=15, help="how many extra imports to list")
+
+    args = parser.parse_args(argv)
+    if args.command == "crossover":
+        print_crossover(measure_crossover(pairs_per_size=args.pairs, repeat=args.repeat))
+    elif args.command == "suite":
+        report = run_suite(args.sizes, args.distributions, args.batch_sizes,
+                           args.warmup, args.repeat, args.seed, progress=print_result)
+        if args.startup_runs:
+            for result in startup_cases(args.startup_runs):
+                report["results"].append(result)
+                print_result(result)
+        if args.output:
+            with open(args.output, "w", encoding="utf-8") as f:
+                json.dump(report, f, indent=2)
+            print(f"\n💾 Saved {len(report['results'])} results to {args.output}")
+    elif args.command == "lcm":
+        print_lcm_comparison([measure_lcm_step(bits, args.repeat) for bits in args.bits])
+    elif args.command == "startup":
+        print_startup(args.runs, args.top)
+    elif args.command == "compare":
+        with open(args.old, encoding="utf-8") as f:
+            old = json.load(f)
+        with open(args.new, encoding="utf-8") as f:
+            new = json.load(f)
+        if print_comparison(compare_results(old, new), args.threshold):
+            sys.exit(1)
+
+if __name__ == "__main__":
+    main()
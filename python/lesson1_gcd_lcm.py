@@ -4,7 +4,15 @@ GCD and LCM Calculator for Kids!
 Learn about Greatest Common Divisor and Least Common Multiple
 """
 
-def find_gcd(a, b):
+import time
+
+# Only modules that are (nearly) free to import go up here, so that
+# `python lesson1_run.py compute 48 18` starts about as fast as Python
+# itself. Everything else is imported inside the function that needs it.
+# (lesson1_run.py imports this file, so Python reuses its compiled
+# bytecode instead of compiling all of it again on every run.)
+
+def find_gcd(a, b, algorithm="euclid"):
     """
     Find the Greatest Common Divisor (GCD) of two numbers.
     
@@ -36,13 +44,28 @@ def find_gcd(a, b):
     
     This is much faster than finding all factors because it just uses division
     and remainders, not prime factorization.
+    
+    OTHER ALGORITHMS (for really big numbers):
+    - algorithm="euclid": the loop above (the default)
+    - algorithm="binary": Stein's algorithm, only halves and subtracts
+    - algorithm="lehmer": Lehmer's algorithm, does most steps on the leading
+      64 bits of the numbers instead of the whole (huge) numbers
+    - algorithm="auto":   picks euclid or lehmer from the size of the numbers
+    The binary, lehmer and auto answers are never negative.
+    
+    To count how many times the loop goes around, see trace_gcd().
     """
+    if _active_trace is not None:
+        return _active_trace.run(a, b, algorithm)
+    if algorithm != "euclid":
+        return _gcd_engine(algorithm)(a, b)
+    
     # Keep dividing until we can't divide anymore
     while b:
         a, b = b, a % b
     return a
 
-def find_lcm(a, b):
+def find_lcm(a, b, *, limit=None, on_overflow="raise"):
     """
     Find the Least Common Multiple (LCM) of two numbers.
     
@@ -56,9 +79,747 @@ def find_lcm(a, b):
     - Multiples of 6: 6, 12, 18, 24, 30, ...
     - Common multiples: 12, 24, 36, ...
     - LCM = 12 (the smallest common multiple)
+    
+    HOW WE COMPUTE IT:
+    LCM = (a × b) ÷ GCD(a, b), but we divide FIRST: LCM = (a ÷ GCD) × b.
+    It's the same answer (GCD divides a exactly), and the number in the
+    middle is never bigger than the answer, which matters for huge numbers.
+    Example: LCM of 4 and 6 = (4 ÷ 2) × 6 = 12
+    
+    Zero and negative numbers: the LCM of 0 and anything is 0, and the
+    answer is never negative (the LCM of -4 and 6 is 12).
+    
+    LIMIT (for programs that need the answer to fit in a fixed size):
+    If the LCM would be bigger than `limit`, on_overflow="raise" raises
+    OverflowError and on_overflow="saturate" returns `limit` instead. This
+    is checked before multiplying, so a too-big LCM is never even built.
+    Both have to be given by name: find_lcm(a, b, limit=10**9).
+    """
+    if limit is not None or on_overflow != "raise":
+        # Checked before anything else, so a typo fails even for find_lcm(0, 5)
+        if on_overflow not in ("raise", "saturate"):
+            raise ValueError(f"on_overflow must be 'raise' or 'saturate', not {on_overflow!r}")
+        if limit is not None and limit < 0:
+            raise ValueError(f"limit can't be negative (an LCM never is), got {limit}")
+    a, b = abs(a), abs(b)
+    if a == 0 or b == 0:
+        return 0
+    
+    # LCM = (a ÷ GCD(a, b)) × b. The GCD is worked out right here instead of
+    # through find_gcd(algorithm="auto"), so everyday numbers only pay for
+    # the Euclidean loop itself; only huge ones switch to Lehmer.
+    if _active_trace is not None:
+        g = _active_trace.run(a, b, "auto")
+    elif a >= _LEHMER_MIN_VALUE and b >= _LEHMER_MIN_VALUE:
+        g = _lehmer_gcd(a, b)
+    else:
+        x, y = a, b
+        while y:
+            x, y = y, x % y
+        g = x
+    quotient = a // g
+    if limit is not None and quotient > limit // b:
+        if on_overflow == "saturate":
+            return limit
+        raise OverflowError(f"LCM is bigger than the limit {limit}")
+    return quotient * b
+
+# ============================================================================
+# GCD ENGINES (different ways to get the same answer)
+# ============================================================================
+
+# Below this many bits, plain Euclid beats Lehmer in CPython because every
+# `a % b` is one fast C call. Measured with `python lesson1_gcd_bench.py
+# crossover`; re-run it and update this number if the interpreter changes.
+LEHMER_MIN_BITS = 6144
+
+# The smallest number with LEHMER_MIN_BITS bits; comparing with it is
+# quicker than asking for bit_length() on every find_lcm call
+_LEHMER_MIN_VALUE = 1 << (LEHMER_MIN_BITS - 1)
+
+# How many leading bits Lehmer's algorithm works on at a time
+LEHMER_WORD_BITS = 62
+
+def _euclid_gcd(a, b):
+    """The plain Euclidean loop from find_gcd, on non-negative numbers."""
+    a, b = abs(a), abs(b)
+    while b:
+        a, b = b, a % b
+    return a
+
+def _binary_gcd(a, b):
+    """
+    Stein's binary GCD: no division at all, only shifts and subtraction.
+    
+    1. Pull out the factors of 2 that a and b share (that is `shift`).
+    2. An even number can lose its factors of 2, because the other
+       number is odd and so 2 can't be part of the GCD any more.
+    3. Subtract the smaller odd number from the bigger one (that gives an
+       even number) and go back to step 2 until one number is 0.
+    """
+    a, b = abs(a), abs(b)
+    if a == 0:
+        return b
+    if b == 0:
+        return a
+    # x & -x keeps only the lowest 1 bit, so its bit_length counts the zeros
+    shift = ((a | b) & -(a | b)).bit_length() - 1
+    a >>= (a & -a).bit_length() - 1
+    while b:
+        b >>= (b & -b).bit_length() - 1
+        if a > b:
+            a, b = b, a
+        b -= a
+    return a << shift
+
+def _lehmer_gcd(a, b):
+    """
+    Lehmer's GCD (Knuth, TAOCP vol. 2, Algorithm L).
+    
+    The quotients at the start of the Euclidean loop only depend on the
+    leading bits of a and b. So we run Euclid on just the leading word x, y
+    and remember the steps as a small matrix [[A, B], [C, D]]. Only when the
+    word-sized guesses stop being safe do we touch the full numbers, doing
+    several Euclid steps with one multiply-and-add instead of one huge
+    division per step.
+    """
+    a, b = abs(a), abs(b)
+    if a < b:
+        a, b = b, a
+    while b.bit_length() > LEHMER_WORD_BITS:
+        shift = a.bit_length() - LEHMER_WORD_BITS
+        x, y = a >> shift, b >> shift
+        A, B, C, D = 1, 0, 0, 1
+        while y + C and y + D:
+            q = (x + A) // (y + C)
+            if q != (x + B) // (y + D):
+                break
+            A, B, x, C, D, y = C, D, y, A - q * C, B - q * D, x - q * y
+        if B == 0:
+            # The leading word gave no safe step, so do one full Euclid step
+            a, b = b, a % b
+        else:
+            a, b = A * a + B * b, C * a + D * b
+    # What is left fits in a machine word, so finish with plain Euclid
+    while b:
+        a, b = b, a % b
+    return a
+
+def _auto_gcd(a, b):
+    """Use Lehmer for huge numbers and Euclid for everything else."""
+    a, b = abs(a), abs(b)
+    if min(a, b).bit_length() >= LEHMER_MIN_BITS:
+        return _lehmer_gcd(a, b)
+    return _euclid_gcd(a, b)
+
+GCD_ALGORITHMS = {
+    "euclid": _euclid_gcd,
+    "binary": _binary_gcd,
+    "lehmer": _lehmer_gcd,
+    "auto": _auto_gcd,
+}
+
+def _gcd_engine(algorithm):
+    """Look up a GCD function by name."""
+    try:
+        return GCD_ALGORITHMS[algorithm]
+    except KeyError:
+        choices = ", ".join(sorted(GCD_ALGORITHMS))
+        raise ValueError(f"Unknown GCD algorithm {algorithm!r}, choose one of: {choices}") from None
+
+# ============================================================================
+# GCD AND LCM OF MANY NUMBERS
+# ============================================================================
+
+def gcd_many(numbers, algorithm="auto"):
+    """
+    Find the GCD of any number of numbers, like gcd_many([12, 18, 30]) -> 6.
+
+    GCD(a, b, c) = GCD(GCD(a, b), c), so we walk through the numbers one at
+    a time keeping a running GCD. `numbers` can be any iterable, even a
+    generator, and is never copied into a list. Once the running GCD is 1
+    it can't get any smaller, so we stop reading right there.
+
+    The GCD of no numbers at all is 0 (0 is divisible by everything).
+    """
+    gcd = _gcd_engine(algorithm)
+    result = 0
+    for number in numbers:
+        result = gcd(result, number)
+        if result == 1:
+            break
+    return result
+
+def lcm_many(numbers):
+    """
+    Find the LCM of any number of numbers, like lcm_many([4, 6, 10]) -> 60.
+
+    Folding left to right, LCM(LCM(LCM(a, b), c), d), makes one side of
+    every step the big running answer. Instead we combine numbers like a
+    knockout tournament: pairs, then pairs of pairs, and so on, so both
+    sides of each step are about the same size. Only one partial answer
+    per round is kept (about log2(n) numbers), so even millions of inputs
+    from a generator need almost no memory.
+
+    The answer is never negative. If any number is 0 the LCM is 0 and we
+    stop early; the LCM of no numbers at all is 1.
+    """
+    # Each entry is (round, value); rounds only go down from bottom to top
+    stack = []
+    for number in numbers:
+        value, level = abs(number), 0
+        if value == 0:
+            return 0
+        while stack and stack[-1][0] == level:
+            value = find_lcm(stack.pop()[1], value)
+            level += 1
+        stack.append((level, value))
+
+    result = 1
+    while stack:
+        result = find_lcm(stack.pop()[1], result)
+    return result
+
+# ============================================================================
+# EXTENDED EUCLID AND MODULAR INVERSES
+# ============================================================================
+
+def extended_gcd(a, b):
+    """
+    Find g = GCD(a, b) and two numbers x, y with a*x + b*y = g.
+
+    Example: extended_gcd(48, 18) -> (6, -1, 3) because 48*(-1) + 18*3 = 6
+
+    This is the same loop as find_gcd, but we also keep track of how each
+    remainder is made out of a and b. At the start a = 1*a + 0*b and
+    b = 0*a + 1*b; every time we compute a % b = a - q*b, we do the same
+    subtraction on the "recipes", so when the loop ends the recipe for the
+    GCD is the answer (x, y). These are called Bézout coefficients.
+
+    g is never negative.
+    """
+    old_r, r = a, b
+    old_x, x = 1, 0
+    old_y, y = 0, 1
+    while r:
+        q = old_r // r
+        old_r, r = r, old_r - q * r
+        old_x, x = x, old_x - q * x
+        old_y, y = y, old_y - q * y
+    if old_r < 0:
+        old_r, old_x, old_y = -old_r, -old_x, -old_y
+    return old_r, old_x, old_y
+
+def mod_inverse(a, m):
+    """
+    Find the number x in range(m) with (a * x) % m == 1.
+
+    Example: mod_inverse(3, 7) -> 5 because 3 * 5 = 15 = 2*7 + 1
+
+    From extended_gcd(a, m) we get a*x + m*y = 1, and taking both sides
+    % m leaves a*x % m == 1. That only works when GCD(a, m) is 1, so any
+    other a raises ValueError.
+    """
+    if m <= 0:
+        raise ValueError(f"Modulus must be positive, got {m}")
+    g, x, _ = extended_gcd(a % m, m)
+    if g != 1:
+        raise ValueError(f"{a} has no inverse modulo {m} (they share the factor {g})")
+    return x % m
+
+def mod_inverse_batch(values, m):
+    """
+    Find mod_inverse(v, m) for every v in values, returned as a list.
+
+    Montgomery's trick: multiply everything together, invert that one
+    product, then peel the single answers back out.
+    - prefix[i] = v0 * v1 * ... * vi          (n - 1 multiplications)
+    - inv = 1 / prefix[-1]                    (the only real inversion)
+    - walking backwards, inverse of vi = inv * prefix[i-1], and then
+      inv * vi becomes the inverse of prefix[i-1]   (2(n - 1) multiplications)
+    So n inversions cost one inversion plus 3(n - 1) multiplications.
+
+    If any value has no inverse modulo m, ValueError names the first one.
+    """
+    if m <= 0:
+        raise ValueError(f"Modulus must be positive, got {m}")
+    originals = list(values)
+    values = [v % m for v in originals]
+    if not values:
+        return []
+
+    prefix = []
+    running = 1
+    for v in values:
+        running = running * v % m
+        prefix.append(running)
+
+    try:
+        inv = mod_inverse(running, m)
+    except ValueError:
+        # Find which value is to blame, so the error message is useful
+        # (and names the value as it was passed in, not reduced mod m)
+        for v in originals:
+            mod_inverse(v, m)
+        raise
+
+    inverses = [0] * len(values)
+    for i in range(len(values) - 1, 0, -1):
+        inverses[i] = inv * prefix[i - 1] % m
+        inv = inv * values[i] % m
+    inverses[0] = inv
+    return inverses
+
+# ============================================================================
+# REMEMBERING ANSWERS (a cache for repeated pairs)
+# ============================================================================
+
+class GCDCache:
+    """
+    Remember GCDs we already worked out, so repeated pairs are instant.
+
+    Example:
+        cache = GCDCache(maxsize=10000)
+        cache.gcd(48, 18)   # works it out (a "miss")
+        cache.gcd(-18, 48)  # same pair, so it is remembered (a "hit")
+        cache.stats()       # {'hits': 1, 'misses': 1, ...}
+
+    GCD(a, b) = GCD(b, a) = GCD(-a, b), so the pair is stored as
+    (smaller, bigger) of the absolute values and all of those share one
+    entry. When the cache is full, the pair used longest ago is forgotten
+    (LRU = "least recently used"); `evictions` counts how often that happened.
+
+    For small numbers, building the key and looking it up costs more than
+    just running Euclid, so pairs where both numbers have fewer than
+    `min_bits` bits skip the cache (and don't count as hits or misses).
+    Setting `enabled = False` turns the cache off completely.
+
+    One cache can be shared by many threads; a lock protects the entries
+    and counters, and the GCD itself is computed outside the lock.
+    """
+
+    # A cache hit costs about the same as Euclid on ~20-bit numbers, so
+    # below 32 bits skipping the cache is at least as fast
+    def __init__(self, maxsize=4096, min_bits=32, algorithm="auto"):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+        self.maxsize = maxsize
+        self.min_bits = min_bits
+        self.enabled = True
+        import threading
+        from collections import OrderedDict
+
+        self._gcd = _gcd_engine(algorithm)
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def gcd(self, a, b):
+        """GCD of a and b (never negative), using the cache when it pays off."""
+        a, b = abs(a), abs(b)
+        if a > b:
+            a, b = b, a
+        if not self.enabled or b.bit_length() < self.min_bits:
+            return self._gcd(a, b)
+
+        key = (a, b)
+        with self._lock:
+            g = self._entries.get(key)
+            if g is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return g
+            self.misses += 1
+
+        g = self._gcd(a, b)
+        with self._lock:
+            self._entries[key] = g
+            self._entries.move_to_end(key)
+            if len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return g
+
+    def lcm(self, a, b):
+        """LCM of a and b (never negative), sharing the cached GCDs."""
+        g = self.gcd(a, b)
+        if g == 0:
+            return 0
+        return abs(a) // g * abs(b)
+
+    def stats(self):
+        """Counters that show whether the cache is worth it."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "hit_rate": self.hits / lookups if lookups else 0.0,
+            }
+
+    def clear(self):
+        """Forget every remembered pair and reset the counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.evictions = 0
+
+# ============================================================================
+# TRACING (how many steps did the Euclidean loop take?)
+# ============================================================================
+
+# The trace that find_gcd reports to, set by trace_gcd(). With no trace
+# active, find_gcd only pays for one `is not None` test before its loop.
+_active_trace = None
+
+class GCDTrace:
+    """
+    Statistics about every find_gcd call made while it is active.
+
+    For each call it notes the bit lengths of the two numbers, how many
+    times the Euclidean loop went around, and how long it took. Only
+    totals, histograms and the `keep_worst` calls with the most iterations
+    are kept, so tracing millions of calls doesn't use up memory.
+
+    - label:        a name for where the numbers came from, copied into
+                    every record so traces of different sources can be compared
+    - callback:     called with each call's record (a dict) as it happens
+    - record_steps: also keep every (a, b, remainder) step, like the
+                    walkthrough in find_gcd's docstring (slower!)
+
+    Iterations are counted whenever the Euclidean loop runs: for
+    algorithm="euclid" (find_gcd's default) and for "auto" when it picks
+    Euclid, which is what find_lcm uses, so LCMs are traced too. Other
+    algorithms (and "auto" on huge numbers) are timed but have iterations None.
+    """
+
+    def __init__(self, label=None, callback=None, keep_worst=10, record_steps=False):
+        import threading
+        from collections import Counter
+
+        self.label = label
+        self.callback = callback
+        self.keep_worst = keep_worst
+        self.record_steps = record_steps
+        self.calls = 0
+        self.total_iterations = 0
+        self.total_seconds = 0.0
+        self.iterations = Counter()   # iterations -> number of calls
+        self.bit_lengths = Counter()  # lowest bit length of the bucket -> calls
+        self._worst = []              # min-heap of (iterations, call number, record)
+        self._lock = threading.Lock()
+
+    def run(self, a, b, algorithm="euclid"):
+        """Work out find_gcd(a, b, algorithm) while measuring it."""
+        record = {"label": self.label, "algorithm": algorithm, "a": a, "b": b,
+                  "a_bits": abs(a).bit_length(), "b_bits": abs(b).bit_length()}
+        steps = [] if self.record_steps else None
+        if algorithm == "auto" and min(abs(a), abs(b)).bit_length() < LEHMER_MIN_BITS:
+            # auto would pick Euclid here, so run (and count) the loop ourselves
+            a, b, algorithm = abs(a), abs(b), "euclid"
+        start = time.perf_counter()
+        if algorithm == "euclid":
+            iterations = 0
+            while b:
+                remainder = a % b
+                if steps is not None:
+                    steps.append((a, b, remainder))
+                a, b = b, remainder
+                iterations += 1
+            result = a
+        else:
+            result = _gcd_engine(algorithm)(a, b)
+            iterations = None
+        record["seconds"] = time.perf_counter() - start
+        record["iterations"] = iterations
+        record["gcd"] = result
+        if steps is not None:
+            record["steps"] = steps
+        self._add(record)
+        return result
+
+    def _add(self, record):
+        import heapq
+
+        with self._lock:
+            self.calls += 1
+            self.total_seconds += record["seconds"]
+            bits = max(record["a_bits"], record["b_bits"])
+            self.bit_lengths[1 << (bits.bit_length() - 1) if bits else 0] += 1
+            iterations = record["iterations"]
+            if iterations is not None:
+                self.total_iterations += iterations
+                self.iterations[iterations] += 1
+                entry = (iterations, self.calls, record)
+                if len(self._worst) < self.keep_worst:
+                    heapq.heappush(self._worst, entry)
+                elif self.keep_worst:
+                    heapq.heappushpop(self._worst, entry)
+        if self.callback is not None:
+            self.callback(record)
+
+    def worst_calls(self):
+        """The traced calls with the most iterations, most first."""
+        return [record for *_, record in sorted(self._worst, key=lambda e: e[:2], reverse=True)]
+
+    def summary(self):
+        """Totals and histograms as a plain dict."""
+        counted = sum(self.iterations.values())
+        return {
+            "label": self.label,
+            "calls": self.calls,
+            "total_seconds": self.total_seconds,
+            "mean_iterations": self.total_iterations / counted if counted else 0.0,
+            "max_iterations": max(self.iterations, default=0),
+            "iterations_histogram": dict(sorted(self.iterations.items())),
+            "bit_length_histogram": dict(sorted(self.bit_lengths.items())),
+        }
+
+    def report(self, width=40):
+        """A printable report with bar charts of the histograms."""
+        summary = self.summary()
+        title = f"GCD trace: {self.label}" if self.label else "GCD trace"
+        lines = [title, "=" * len(title),
+                 f"calls: {summary['calls']:,}   time: {summary['total_seconds']:.4f}s   "
+                 f"iterations: mean {summary['mean_iterations']:.1f}, max {summary['max_iterations']}"]
+
+        def bars(heading, histogram, name):
+            lines.append("")
+            lines.append(heading)
+            biggest = max(histogram.values(), default=0)
+            for key, count in histogram.items():
+                bar = "#" * max(1, round(width * count / biggest))
+                lines.append(f"  {name(key):>14} | {bar} {count:,}")
+
+        bars("iterations per call:", summary["iterations_histogram"], str)
+        bars("bigger operand size:", summary["bit_length_histogram"],
+             lambda low: f"{low}-{2 * low - 1} bits" if low else "0 bits")
+
+        worst = self.worst_calls()
+        if worst:
+            lines.append("")
+            lines.append("most iterations:")
+            for record in worst:
+                lines.append(f"  {record['iterations']:>5} iterations: {record['a_bits']}-bit and "
+                             f"{record['b_bits']}-bit numbers ({record['seconds'] * 1e6:.1f}us)")
+        return "\n".join(lines)
+
+class trace_gcd:
+    """
+    Trace every find_gcd call inside a `with` block.
+
+    Example:
+        with trace_gcd(GCDTrace(label="fractions")) as trace:
+            find_gcd(48, 18)
+            find_lcm(4, 6)
+        print(trace.report())
+
+    With no argument a new GCDTrace is made. When the block ends, find_gcd
+    goes back to the plain loop (or to an outer trace, if blocks are nested).
+    Tracing is switched on for the whole program, not just one thread.
+    """
+
+    # A class instead of @contextlib.contextmanager, so importing this
+    # module doesn't import contextlib
+    def __init__(self, trace=None):
+        self.trace = trace if trace is not None else GCDTrace()
+        self._previous = None
+
+    def __enter__(self):
+        global _active_trace
+        self._previous, _active_trace = _active_trace, self.trace
+        return self.trace
+
+    def __exit__(self, *exc_info):
+        global _active_trace
+        _active_trace = self._previous
+        return False
+
+# ============================================================================
+# BATCH GCD AND LCM (for lots of pairs at once, needs NumPy)
+# ============================================================================
+
+INT64_MAX = 2**63 - 1
+INT64_MIN = -(2**63)
+
+def as_int_array(values):
+    """
+    values as a NumPy array, keeping whole numbers whole.
+
+    np.asarray([1, 2**63]) gives a float64 array: int64 can't hold 2**63
+    and uint64 can't hold negative numbers, so NumPy picks floats, which
+    lose digits. Here a list like that becomes int64, uint64 or an object
+    array of Python ints, the first one every value fits in. NumPy arrays
+    (and lists with real fractions like 1.5) come back as np.asarray gives them.
     """
-    # LCM = (a × b) ÷ GCD(a, b)
-    return (a * b) // find_gcd(a, b)
+    import numpy as np
+
+    arr = np.asarray(values)
+    if arr.dtype.kind != "f" or isinstance(values, np.ndarray):
+        return arr
+    items = np.array(values, dtype=object)
+    if not all(isinstance(v, (int, np.integer)) for v in items.flat):
+        return arr
+    for dtype in (np.int64, np.uint64):
+        try:
+            return np.array(values, dtype=dtype)
+        except OverflowError:
+            pass
+    return items
+
+def _batch_operands(a, b):
+    """
+    Turn two array-likes into broadcast, non-negative, flat working arrays.
+
+    Returns (x, y, shape) where x and y are 1-D copies holding |a| and |b|.
+    They are int64 when every value fits in a machine word, and object
+    arrays of Python ints otherwise (big numbers, or uint64 values above
+    the int64 range).
+    """
+    import numpy as np
+
+    a = as_int_array(a)
+    b = as_int_array(b)
+    for arr in (a, b):
+        if arr.size and arr.dtype.kind not in "biuO":
+            raise TypeError(f"GCD needs integers, got an array of {arr.dtype}")
+    a, b = np.broadcast_arrays(a, b)
+    shape = a.shape
+
+    def fits_int64(arr):
+        # abs(INT64_MIN) does not fit in int64, so it needs big ints too
+        if arr.size == 0:
+            return True
+        if arr.dtype.kind == "O":
+            return all(INT64_MIN < int(v) <= INT64_MAX for v in arr.flat)
+        if arr.dtype.kind == "u":
+            return int(arr.max()) <= INT64_MAX
+        return int(arr.min()) > INT64_MIN
+
+    if fits_int64(a) and fits_int64(b):
+        x = np.abs(a.astype(np.int64)).ravel()
+        y = np.abs(b.astype(np.int64)).ravel()
+    else:
+        x = np.array([abs(int(v)) for v in a.ravel()], dtype=object)
+        y = np.array([abs(int(v)) for v in b.ravel()], dtype=object)
+    return x, y, shape
+
+def _euclid_lanes(x, y):
+    """
+    Run the Euclidean loop on every lane of x and y at the same time.
+
+    After each step, lanes whose remainder reached 0 are finished: their
+    GCD is written to the result and they are dropped, so the arrays we
+    keep dividing only hold the pairs that are still going.
+    """
+    import numpy as np
+
+    result = np.empty_like(x)
+    lanes = np.arange(x.size)
+    while lanes.size:
+        finished = y == 0
+        if finished.any():
+            result[lanes[finished]] = x[finished]
+            going = ~finished
+            lanes, x, y = lanes[going], x[going], y[going]
+        if lanes.size:
+            x, y = y, x % y
+    return result
+
+def find_gcd_batch(a, b):
+    """
+    Find the GCD of many pairs of numbers at once.
+
+    a and b can be lists or NumPy arrays of the same length (or shapes that
+    NumPy can broadcast, like an array and a single number). Every pair goes
+    through the same Euclidean Algorithm as find_gcd, but each step is done
+    for the whole array in one go instead of one pair at a time.
+
+    Example: find_gcd_batch([48, 12, 9], [18, 8, 16]) -> array([6, 4, 1])
+
+    Unlike find_gcd, the answer is never negative (just like math.gcd).
+    Numbers that fit in 64 bits are worked on as int64 at full NumPy speed;
+    anything bigger falls back to an object array of Python ints, which is
+    slower but never loses digits.
+    """
+    x, y, shape = _batch_operands(a, b)
+    return _euclid_lanes(x, y).reshape(shape)
+
+def find_lcm_batch(a, b, *, limit=None, on_overflow="raise"):
+    """
+    Find the LCM of many pairs of numbers at once.
+
+    Takes the same inputs as find_gcd_batch and returns non-negative LCMs.
+    Like find_lcm, we divide before we multiply, LCM = (|a| ÷ GCD) × |b|,
+    so the middle step never gets bigger than the answer. The LCM of 0 and
+    anything is 0.
+
+    An LCM can be much bigger than both numbers, so with int64 inputs the
+    answer might not fit in 64 bits. Instead of silently wrapping around,
+    on_overflow decides what happens to an LCM bigger than the bound:
+    - "raise":    raise OverflowError (the default)
+    - "saturate": put the bound there instead, keeping an int64 array
+    - "object":   return an object array of exact Python ints instead
+
+    The bound is `limit` if given (and at most the int64 maximum for int64
+    inputs); big-int inputs have no bound unless you give one. Every lane
+    is checked before multiplying, so no Python big ints are ever built
+    unless "object" asks for them. Like find_lcm's, limit and on_overflow
+    have to be given by name.
+    """
+    return find_gcd_lcm_batch(a, b, limit=limit, on_overflow=on_overflow)[1]
+
+def find_gcd_lcm_batch(a, b, *, limit=None, on_overflow="raise"):
+    """
+    Find the GCD and the LCM of many pairs at once, as (gcds, lcms).
+
+    Same inputs and options as find_lcm_batch. The LCM needs the GCD
+    anyway, so asking for both here runs the Euclidean loop once instead
+    of once in find_gcd_batch and again in find_lcm_batch.
+    """
+    import numpy as np
+
+    if on_overflow not in ("raise", "saturate", "object"):
+        raise ValueError(f"on_overflow must be 'raise', 'saturate' or 'object', not {on_overflow!r}")
+    if on_overflow == "object" and limit is not None:
+        raise ValueError("on_overflow='object' keeps exact LCMs, so it can't take a limit")
+    if limit is not None and limit < 0:
+        raise ValueError(f"limit can't be negative (an LCM never is), got {limit}")
+
+    x, y, shape = _batch_operands(a, b)
+    g = _euclid_lanes(x, y)
+    # gcd is 0 only when both numbers are 0, and then the LCM is 0 too
+    nonzero = g != 0
+    quotient = np.zeros_like(x)
+    quotient[nonzero] = x[nonzero] // g[nonzero]
+
+    if x.dtype == object:
+        bound = limit
+    else:
+        bound = INT64_MAX if limit is None else min(limit, INT64_MAX)
+    if bound is None:
+        return g.reshape(shape), (quotient * y).reshape(shape)
+
+    # quotient × y > bound exactly when quotient > bound // y
+    max_quotient = bound // np.where(y == 0, 1, y)
+    overflow = quotient > max_quotient
+    if overflow.any():
+        if on_overflow == "raise":
+            first = int(np.flatnonzero(overflow)[0])
+            raise OverflowError(
+                f"LCM of {int(x[first])} and {int(y[first])} is bigger than {bound}"
+            )
+        if on_overflow == "object":
+            return g.reshape(shape), (quotient.astype(object) * y.astype(object)).reshape(shape)
+        quotient[overflow] = 0
+        result = quotient * y
+        result[overflow] = bound
+        return g.reshape(shape), result.reshape(shape)
+    return g.reshape(shape), (quotient * y).reshape(shape)
 
 def show_examples():
     """Show some fun examples of GCD and LCM!"""
@@ -126,18 +887,103 @@ def interactive_calculator():
             print("\n\nThanks for learning! 👋")
             break
 
-def main():
+def compute(numbers):
+    """Print the GCD and LCM of some numbers (the `compute` command)."""
+    shown = ", ".join(str(n) for n in numbers)
+    print(f"GCD({shown}) = {gcd_many(numbers)}")
+    print(f"LCM({shown}) = {lcm_many(numbers)}")
+
+def _parse_compute(args):
+    """The numbers for `compute`, or None if they need argparse's error messages."""
+    if len(args) < 2:
+        return None
+    try:
+        return [int(arg) for arg in args]
+    except ValueError:
+        return None
+
+def _build_parser():
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        description="GCD and LCM Calculator for Kids! (no command: examples, then the calculator)")
+    commands = parser.add_subparsers(dest="command", metavar="command")
+
+    commands.add_parser("examples", help="show some examples")
+    commands.add_parser("interactive", help="type in your own numbers")
+
+    compute_command = commands.add_parser("compute", help="print the GCD and LCM of some numbers")
+    compute_command.add_argument("numbers", nargs="+", type=int, metavar="NUMBER")
+
+    # main() hands `bench ...` to lesson1_gcd_bench before argparse sees it
+    commands.add_parser("bench", add_help=False, help="timing experiments (see: bench --help)")
+
+    parallel = commands.add_parser("parallel", help="solve every pair in a file on all CPU cores")
+    parallel.add_argument("file", nargs="?", default="-",
+                          help="pairs file, one pair per line (default: stdin)")
+    parallel.add_argument("--format", choices=("csv", "jsonl"), default="csv",
+                          help="output as a,b,gcd,lcm lines or JSON Lines (default: csv)")
+    parallel.add_argument("-o", "--output", default="-",
+                          help="where to write the results (default: stdout)")
+    parallel.add_argument("--workers", type=int, default=None,
+                          help="worker processes (default: one per core)")
+    parallel.add_argument("--chunk-size", type=int, default=50_000,
+                          help="pairs sent to a worker at a time (default: 50000)")
+
+    stream = commands.add_parser("stream", help="read pairs from stdin, write results to stdout")
+    stream.add_argument("--format", choices=("csv", "jsonl"), default="csv",
+                        help="output as a,b,gcd,lcm lines or JSON Lines (default: csv)")
+    stream.add_argument("-q", "--quiet", action="store_true",
+                        help="don't report pairs/second on stderr")
+
+    binary = commands.add_parser("binary", help="solve a packed 64-bit binary pair file (needs NumPy)")
+    binary.add_argument("file", help="binary pairs file")
+    binary.add_argument("-o", "--output", required=True, help="binary results file")
+    binary.add_argument("--dtype", choices=("int64", "uint64"), default="int64",
+                        help="number type in the files (default: int64)")
+    return parser
+
+def main(argv=None):
     """Main function to run our GCD and LCM learning program!"""
-    print("=" * 50)
-    print("🌟 Welcome to GCD and LCM Learning! 🌟")
-    print("=" * 50)
-    print()
-    
-    # Show examples first
-    show_examples()
-    
-    # Then let kids try it themselves
-    interactive_calculator()
+    import sys
+
+    argv = sys.argv[1:] if argv is None else list(argv)
+
+    # The one-shot path: no argparse and no other imports, so a quick
+    # `compute 48 18` costs little more than starting Python
+    if argv[:1] == ["compute"]:
+        numbers = _parse_compute(argv[1:])
+        if numbers is not None:
+            compute(numbers)
+            return
+    # bench has its own options, so pass them straight through
+    if argv[:1] == ["bench"]:
+        from lesson1_gcd_bench import main as bench_main
+        bench_main(argv[1:])
+        return
+
+    args = _build_parser().parse_args(argv)
+    if args.command == "compute":
+        compute(args.numbers)
+    elif args.command == "stream":
+        from lesson1_gcd_pipeline import stream_main
+        stream_main(args.format, quiet=args.quiet)
+    elif args.command == "binary":
+        from lesson1_gcd_pipeline import binary_main
+        binary_main(args.file, args.output, args.dtype)
+    elif args.command == "parallel":
+        from lesson1_gcd_pipeline import parallel_main
+        parallel_main(args.file, args.output, args.workers, args.chunk_size, args.format)
+    else:
+        print("=" * 50)
+        print("🌟 Welcome to GCD and LCM Learning! 🌟")
+        print("=" * 50)
+        print()
+
+        if args.command in (None, "examples"):
+            show_examples()
+        if args.command in (None, "interactive"):
+            interactive_calculator()
 
 if __name__ == "__main__":
     main()
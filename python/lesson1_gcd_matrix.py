@@ -0,0 +1,215 @@
+#!/usr/bin/env python3
+"""
+GCD of every pair in a list of numbers - all at once!
+
+Two kinds of questions:
+- "What is the GCD of each pair?"  -> gcd_matrix(values), a table where
+  row i, column j holds GCD(values[i], values[j])
+- "How many pairs have GCD = d?"    -> count_pairs_by_gcd(values), which
+  counts without looking at the pairs one by one
+
+Usage:
+    python lesson1_gcd_matrix.py matrix 12 18 24 30
+    python lesson1_gcd_matrix.py count 12 18 24 30
+    python lesson1_gcd_matrix.py count --file numbers.txt
+
+Needs NumPy (pip install numpy).
+"""
+
+import argparse
+import math
+
+import numpy as np
+
+from lesson1_gcd_lcm import as_int_array, find_gcd_batch
+
+# Each tile works on TILE × TILE pairs at once. 256 × 256 pairs need about
+# 2 MB of scratch space, which stays in the CPU cache; bigger tiles were
+# slower, not faster (2000 random 20-bit values: 0.70s at 256, 1.5s at 2048)
+DEFAULT_TILE = 256
+
+# The counting sieve needs arrays as long as the biggest value
+# (about 32 bytes per number); past this, pairs are counted one by one
+MAX_SIEVE_VALUE = 50_000_000
+
+def _as_values(values):
+    """The absolute values as a 1-D array (int64, or object for big numbers)."""
+    arr = as_int_array(values)
+    if arr.ndim != 1:
+        arr = arr.ravel()
+    if arr.size and arr.dtype.kind not in "biuO":
+        raise TypeError(f"GCD needs integers, got an array of {arr.dtype}")
+    # find_gcd_batch(arr, 0) is |arr|, converted to int64 or big ints as needed
+    return find_gcd_batch(arr, 0)
+
+def iter_gcd_tiles(values, tile=DEFAULT_TILE):
+    """
+    Yield (row, column, block) for the upper half of the GCD matrix.
+
+    block[i, j] is GCD(values[row + i], values[column + j]). Only tiles
+    with column >= row are made; the one at (column, row) is block.T.
+    At most tile × tile pairs are worked on at a time, so memory stays
+    small however many values there are.
+    """
+    x = _as_values(values)
+    n = len(x)
+    for row in range(0, n, tile):
+        rows = x[row:row + tile, None]
+        for column in range(row, n, tile):
+            yield row, column, find_gcd_batch(rows, x[None, column:column + tile])
+
+def gcd_matrix(values, tile=DEFAULT_TILE):
+    """
+    The full table of GCDs: result[i, j] = GCD(values[i], values[j]).
+
+    Example: gcd_matrix([12, 18, 8]) ->
+        [[12,  6, 4],
+         [ 6, 18, 2],
+         [ 4,  2, 8]]
+
+    Worked out tile by tile with find_gcd_batch (see iter_gcd_tiles), and
+    only the upper half is computed; the lower half is a mirror copy.
+    """
+    x = _as_values(values)
+    n = len(x)
+    result = np.zeros((n, n), dtype=x.dtype)
+    for row, column, block in iter_gcd_tiles(x, tile):
+        result[row:row + block.shape[0], column:column + block.shape[1]] = block
+        result[column:column + block.shape[1], row:row + block.shape[0]] = block.T
+    return result
+
+# ============================================================================
+# COUNTING PAIRS BY GCD (a sieve over the values, no pairs needed)
+# ============================================================================
+
+def mobius_sieve(limit):
+    """
+    The Möbius function mu(k) for 0 <= k <= limit, as an int8 array.
+
+    mu(k) is 0 if a square divides k, otherwise +1 or -1 for an even or odd
+    number of prime factors. mu[0] is 0.
+    """
+    mu = np.ones(limit + 1, dtype=np.int8)
+    mu[0] = 0
+    is_prime = np.ones(limit + 1, dtype=bool)
+    is_prime[:2] = False
+    for p in range(2, math.isqrt(limit) + 1):
+        if is_prime[p]:
+            is_prime[p * p::p] = False
+    for p in np.flatnonzero(is_prime):
+        mu[p::p] *= -1
+        mu[p * p::p * p] = 0
+    return mu
+
+def _sum_over_multiples(values, weights=None):
+    """
+    out[d] = sum of weights[j] * values[j * d] over j >= 1, for 1 <= d <= M.
+
+    Without weights every weight is 1. This is O(M log M) work, but only
+    about 2 * sqrt(M) Python-level steps: small d go one at a time over
+    all their multiples, and big d (which have fewer than sqrt(M)
+    multiples) go together, one multiplier j at a time.
+    """
+    limit = len(values) - 1
+    out = np.zeros(limit + 1, dtype=np.int64)
+    root = math.isqrt(limit)
+    for d in range(1, root + 1):
+        multiples = values[d::d]
+        if weights is None:
+            out[d] = multiples.sum()
+        else:
+            out[d] = (weights[1:len(multiples) + 1] * multiples).sum()
+    for j in range(1, limit // (root + 1) + 1):
+        if weights is not None and weights[j] == 0:
+            continue
+        high = limit // j  # biggest d with j * d <= limit
+        multiples = values[j * (root + 1):j * high + 1:j]
+        out[root + 1:high + 1] += multiples if weights is None else int(weights[j]) * multiples
+    return out
+
+def _count_with_sieve(x):
+    """count_pairs_by_gcd for int64 values, with the Möbius sieve."""
+    limit = int(x.max()) if len(x) else 0
+    counts = np.bincount(x, minlength=limit + 1).astype(np.int64)
+    zeros = int(counts[0])
+    counts[0] = 0
+
+    # multiples[d] = how many values d divides; each such pair has d | GCD
+    multiples = _sum_over_multiples(counts)
+    divisible_pairs = multiples * (multiples - 1) // 2
+    # Inclusion-exclusion: pairs with GCD exactly d are the pairs with
+    # d | GCD, minus those with 2d | GCD, 3d | GCD, ... = sum of mu(j) * pairs(j*d)
+    exact = _sum_over_multiples(divisible_pairs, mobius_sieve(limit))
+
+    # GCD(0, v) = v, and GCD(0, 0) = 0
+    exact += zeros * counts
+    exact[0] = zeros * (zeros - 1) // 2
+    return {int(d): int(exact[d]) for d in np.flatnonzero(exact)}
+
+def _count_pairwise(x, tile):
+    """count_pairs_by_gcd by working out every GCD, tile by tile."""
+    found = {}
+    for row, column, block in iter_gcd_tiles(x, tile):
+        if row == column:
+            block = block[np.triu_indices(block.shape[0], 1, block.shape[1])]
+        gcds, counts = np.unique(block.ravel(), return_counts=True)
+        for g, count in zip(gcds.tolist(), counts.tolist()):
+            found[g] = found.get(g, 0) + count
+    return dict(sorted(found.items()))
+
+def count_pairs_by_gcd(values, method="auto", tile=DEFAULT_TILE):
+    """
+    How many pairs i < j have GCD(values[i], values[j]) = d, for every d.
+
+    Returns {d: number of pairs}, only for d that happen.
+
+    Example: count_pairs_by_gcd([12, 18, 8]) -> {2: 1, 4: 1, 6: 1}
+
+    method "sieve" never looks at pairs: it counts how many values each d
+    divides, then uses the Möbius function to keep only the pairs whose GCD
+    is exactly d. That takes about M log M steps for values up to M, however
+    many values there are. method "pairs" works out every GCD instead (n²/2
+    of them). "auto" picks the sieve when M is at most n² and small enough
+    to fit in memory.
+    """
+    x = _as_values(values)
+    if method == "auto":
+        n = len(x)
+        biggest = int(x.max()) if n else 0
+        method = "sieve" if x.dtype != object and biggest <= min(n * n, MAX_SIEVE_VALUE) else "pairs"
+    if method == "sieve":
+        if x.dtype == object:
+            raise ValueError("The sieve needs values that fit in 64 bits")
+        return _count_with_sieve(x)
+    if method == "pairs":
+        return _count_pairwise(x, tile)
+    raise ValueError(f"Unknown method {method!r}, expected 'auto', 'sieve' or 'pairs'")
+
+def _read_numbers(path):
+    with open(path, encoding="utf-8") as f:
+        return [int(token) for token in f.read().replace(",", " ").split()]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="GCDs of every pair of numbers")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("matrix", "print the GCD of every pair as a table"),
+                            ("count", "count the pairs with each GCD")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("numbers", nargs="*", type=int)
+        command.add_argument("--file", help="read the numbers from a file instead")
+    args = parser.parse_args(argv)
+
+    numbers = _read_numbers(args.file) if args.file else args.numbers
+    if args.command == "matrix":
+        matrix = gcd_matrix(numbers)
+        width = max((len(str(v)) for v in [*numbers, *matrix.ravel().tolist()]), default=1)
+        print(" " * width + " | " + " ".join(f"{v:>{width}}" for v in numbers))
+        print("-" * (width + 3 + (width + 1) * len(numbers)))
+        for value, row in zip(numbers, matrix.tolist()):
+            print(f"{value:>{width}} | " + " ".join(f"{g:>{width}}" for g in row))
+    else:
+        for d, count in count_pairs_by_gcd(numbers).items():
+            print(f"GCD = {d}: {count} pairs")
+
+if __name__ == "__main__":
+    main()
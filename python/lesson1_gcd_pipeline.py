@@ -0,0 +1,346 @@
+#!/usr/bin/env python3
+"""
+GCD and LCM for huge files of number pairs.
+The lesson's find_gcd, run on every core of the computer at once!
+
+Input is pairs of numbers, like "48 18" or "48,18". `parallel` hands
+whole lines to its workers, so it needs exactly one pair per line;
+`stream` and `to-binary` also accept numbers separated by any spaces,
+newlines or commas, even with a pair split across two lines. Output has
+one line per pair, in the same order, as CSV ("a,b,gcd,lcm") or JSON
+Lines ({"a": .., "b": .., "gcd": .., "lcm": ..}).
+
+Usage:
+    python lesson1_gcd_lcm.py parallel pairs.txt -o results.csv --workers 8
+    cat pairs.txt | python lesson1_gcd_lcm.py parallel
+    cat pairs.txt | python lesson1_gcd_lcm.py stream --format jsonl | head
+
+Binary files (no text parsing at all, needs NumPy):
+    python lesson1_gcd_pipeline.py to-binary pairs.txt pairs.bin
+    python lesson1_gcd_lcm.py binary pairs.bin -o results.bin
+    python lesson1_gcd_pipeline.py to-text results.bin results.txt
+"""
+
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+
+from lesson1_gcd_lcm import find_gcd
+
+DEFAULT_CHUNK_SIZE = 50_000
+
+# `stream` reads stdin in blocks of this many bytes
+DEFAULT_BLOCK_SIZE = 1 << 20
+
+OUTPUT_FORMATS = ("csv", "jsonl")
+
+def gcd_and_lcm(a, b):
+    """GCD and LCM of one pair (never negative), sharing one GCD computation."""
+    g = find_gcd(a, b, algorithm="auto")
+    lcm = abs(a) // g * abs(b) if g else 0
+    return g, lcm
+
+def parse_pair(line):
+    """Turn "48 18" or "48,18" into (48, 18)."""
+    fields = line.replace(",", " ").split()
+    if len(fields) != 2:
+        raise ValueError(f"Expected two numbers per line, got {line.strip()!r}")
+    return int(fields[0]), int(fields[1])
+
+def format_results(pairs, fmt="csv"):
+    """Solve every (a, b) in pairs and return all the output lines as one string."""
+    if fmt == "csv":
+        template = "{},{},{},{}\n"
+    elif fmt == "jsonl":
+        # Python ints are already valid JSON numbers, so no json module needed
+        template = '{{"a":{},"b":{},"gcd":{},"lcm":{}}}\n'
+    else:
+        raise ValueError(f"Unknown output format {fmt!r}, choose one of: {', '.join(OUTPUT_FORMATS)}")
+    out = []
+    for a, b in pairs:
+        g, lcm = gcd_and_lcm(a, b)
+        out.append(template.format(a, b, g, lcm))
+    return "".join(out)
+
+def solve_chunk(lines, fmt="csv"):
+    """
+    Work out one chunk of input lines (this runs inside a worker process).
+
+    Every non-blank line must hold exactly one pair. A pair split across
+    lines can't be allowed here: its two halves might land in different
+    chunks, which different workers solve.
+
+    Returns (number_of_pairs, output_text). Parsing and formatting happen
+    here too, so the main process only has to move text around.
+    """
+    pairs = [parse_pair(line) for line in lines if line.strip()]
+    return len(pairs), format_results(pairs, fmt)
+
+def read_chunks(stream, chunk_size):
+    """Yield lists of at most chunk_size lines, never reading further ahead."""
+    while True:
+        chunk = list(islice(stream, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+def _chunk_result(future):
+    """(count, text) of a finished chunk, with a hint if a pair was split across lines."""
+    try:
+        return future.result()
+    except ValueError as e:
+        if not str(e).startswith("Expected two numbers per line"):
+            raise
+        raise ValueError(f"{e} (`stream` accepts pairs split across lines)") from e
+
+def run_parallel(infile, outfile, workers=None, chunk_size=DEFAULT_CHUNK_SIZE, fmt="csv"):
+    """
+    Solve every pair from infile with a pool of worker processes.
+
+    Chunks are handed out in order and their results are written in the
+    same order. At most 2 chunks per worker are in flight at any time, so
+    memory use stays the same for a thousand pairs or a billion.
+
+    Returns (pairs_done, seconds_taken).
+    """
+    workers = workers or os.cpu_count() or 1
+    max_in_flight = 2 * workers
+    start = time.perf_counter()
+    pairs = 0
+
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        pending = deque()
+        for chunk in read_chunks(infile, chunk_size):
+            pending.append(pool.submit(solve_chunk, chunk, fmt))
+            if len(pending) >= max_in_flight:
+                count, text = _chunk_result(pending.popleft())
+                outfile.write(text)
+                pairs += count
+        while pending:
+            count, text = _chunk_result(pending.popleft())
+            outfile.write(text)
+            pairs += count
+
+    outfile.flush()
+    return pairs, time.perf_counter() - start
+
+def report_throughput(pairs, seconds, stream=sys.stderr):
+    """Tell the user how fast it went (on stderr, so results stay clean)."""
+    rate = pairs / seconds if seconds > 0 else float("inf")
+    print(f"⏱️  {pairs:,} pairs in {seconds:.2f}s ({rate:,.0f} pairs/second)", file=stream)
+
+def parallel_main(path="-", output="-", workers=None, chunk_size=DEFAULT_CHUNK_SIZE, fmt="csv"):
+    """Open the input and output ("-" means stdin/stdout) and run the pool."""
+    infile = sys.stdin if path == "-" else open(path, encoding="utf-8")
+    outfile = sys.stdout if output == "-" else open(output, "w", encoding="utf-8")
+    try:
+        pairs, seconds = run_parallel(infile, outfile, workers, chunk_size, fmt)
+    finally:
+        if infile is not sys.stdin:
+            infile.close()
+        if outfile is not sys.stdout:
+            outfile.close()
+    report_throughput(pairs, seconds)
+
+# ============================================================================
+# STREAMING MODE (one process, for shell pipelines)
+# ============================================================================
+
+_SEPARATORS = b" \t\r\n\v\f,"
+
+def iter_pair_blocks(stream, block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Read a binary stream in big blocks and yield a list of (a, b) per block.
+
+    Numbers may be separated by any whitespace or commas, and a pair may
+    even be split across lines. A number cut in half at the end of a block
+    is kept and glued to the start of the next block.
+    """
+    tail = b""
+    leftover = None
+    while True:
+        block = stream.read(block_size)
+        if not block:
+            break
+        block = tail + block
+        tokens = block.replace(b",", b" ").split()
+        tail = b""
+        if tokens and block[-1] not in _SEPARATORS:
+            tail = tokens.pop()
+
+        numbers = [int(token) for token in tokens]
+        if leftover is not None:
+            numbers.insert(0, leftover)
+            leftover = None
+        if len(numbers) % 2:
+            leftover = numbers.pop()
+        yield list(zip(numbers[::2], numbers[1::2]))
+
+    if tail:
+        if leftover is None:
+            raise ValueError(f"Input ended in the middle of a pair: {tail.decode()!r}")
+        yield [(leftover, int(tail))]
+    elif leftover is not None:
+        raise ValueError(f"Input ended in the middle of a pair: {leftover}")
+
+def run_stream(infile, outfile, fmt="csv", block_size=DEFAULT_BLOCK_SIZE):
+    """
+    Solve every pair from a binary infile and write results to a binary outfile.
+
+    Each input block becomes one write, instead of one print() per pair.
+    Returns (pairs_done, seconds_taken).
+    """
+    start = time.perf_counter()
+    pairs = 0
+    for block in iter_pair_blocks(infile, block_size):
+        if block:
+            outfile.write(format_results(block, fmt).encode("ascii"))
+            pairs += len(block)
+    outfile.flush()
+    return pairs, time.perf_counter() - start
+
+def stream_main(fmt="csv", block_size=DEFAULT_BLOCK_SIZE, quiet=False):
+    """Pipe stdin to stdout; a closed pipe (like `| head`) ends quietly."""
+    try:
+        pairs, seconds = run_stream(sys.stdin.buffer, sys.stdout.buffer, fmt, block_size)
+    except BrokenPipeError:
+        # Stop Python from complaining again when it flushes stdout on exit
+        sys.stdout = None
+        return
+    if not quiet:
+        report_throughput(pairs, seconds)
+
+# ============================================================================
+# BINARY FILES (memory-mapped, needs NumPy)
+# ============================================================================
+
+# A binary pair file is just records of two little-endian 64-bit integers,
+# a then b, with no header. Result files have the same layout: gcd then lcm.
+BINARY_DTYPES = {"int64": "<i8", "uint64": "<u8"}
+
+# Pairs per step when walking through a memory-mapped file (16 MiB of input)
+BINARY_CHUNK_PAIRS = 1 << 20
+
+def open_pair_file(path, dtype="int64"):
+    """Memory-map a binary pair file as an (n, 2) array without reading it."""
+    import numpy as np
+
+    itemsize = np.dtype(BINARY_DTYPES[dtype]).itemsize
+    size = os.path.getsize(path)
+    if size % (2 * itemsize):
+        raise ValueError(f"{path} is {size} bytes, not a whole number of {dtype} pairs")
+    if size == 0:
+        return np.empty((0, 2), dtype=BINARY_DTYPES[dtype])
+    return np.memmap(path, dtype=BINARY_DTYPES[dtype], mode="r").reshape(-1, 2)
+
+def run_binary(in_path, out_path, dtype="int64", chunk_pairs=BINARY_CHUNK_PAIRS):
+    """
+    Write (gcd, lcm) records for every (a, b) record of a binary pair file.
+
+    Both files are memory-mapped and handled one chunk at a time with
+    find_gcd_lcm_batch, so a file bigger than RAM works fine: the operating
+    system pages the data in and out for us.
+
+    A GCD or LCM that does not fit in the output type raises OverflowError
+    instead of writing a wrapped-around number. The results go to a
+    temporary file that only becomes out_path once every chunk is done,
+    so a failed job never leaves half a results file behind.
+    Returns (pairs_done, seconds_taken).
+    """
+    import numpy as np
+    from lesson1_gcd_lcm import find_gcd_lcm_batch
+
+    start = time.perf_counter()
+    pairs = open_pair_file(in_path, dtype)
+    n = len(pairs)
+    out_dtype = BINARY_DTYPES[dtype]
+    if n == 0:
+        open(out_path, "wb").close()
+        return 0, time.perf_counter() - start
+
+    # uint64 LCMs may go past the int64 range but still fit in uint64
+    on_overflow = "object" if dtype == "uint64" else "raise"
+
+    def to_output(values, what):
+        if values.dtype == object:
+            # Big Python ints: let NumPy check each one fits in out_dtype
+            try:
+                return np.array(values.tolist(), dtype=out_dtype)
+            except OverflowError:
+                raise OverflowError(f"{what} does not fit in {dtype}") from None
+        return values
+
+    temporary = f"{out_path}.{os.getpid()}.tmp"
+    results = None
+    try:
+        results = np.memmap(temporary, dtype=out_dtype, mode="w+", shape=(n, 2))
+        for lo in range(0, n, chunk_pairs):
+            chunk = pairs[lo:lo + chunk_pairs]
+            # One Euclidean pass gives both the GCDs and the LCMs
+            gcds, lcms = find_gcd_lcm_batch(chunk[:, 0], chunk[:, 1], on_overflow=on_overflow)
+            results[lo:lo + len(chunk), 0] = to_output(gcds, "A GCD")
+            results[lo:lo + len(chunk), 1] = to_output(lcms, "An LCM")
+        results.flush()
+        results = None  # unmap before renaming
+        os.replace(temporary, out_path)
+    except BaseException:
+        results = None
+        if os.path.exists(temporary):
+            os.remove(temporary)
+        raise
+    return n, time.perf_counter() - start
+
+def binary_main(in_path, out_path, dtype="int64"):
+    """Run a binary job and report the throughput."""
+    pairs, seconds = run_binary(in_path, out_path, dtype)
+    report_throughput(pairs, seconds)
+
+def text_to_binary(text_path, binary_path, dtype="int64", block_size=DEFAULT_BLOCK_SIZE):
+    """Convert a text file of pairs ("-" for stdin) into a binary pair file."""
+    import numpy as np
+
+    infile = sys.stdin.buffer if text_path == "-" else open(text_path, "rb")
+    try:
+        with open(binary_path, "wb") as outfile:
+            for block in iter_pair_blocks(infile, block_size):
+                np.array(block, dtype=BINARY_DTYPES[dtype]).reshape(-1, 2).tofile(outfile)
+    finally:
+        if infile is not sys.stdin.buffer:
+            infile.close()
+
+def binary_to_text(binary_path, text_path, dtype="int64", chunk_pairs=BINARY_CHUNK_PAIRS):
+    """Convert a binary pair or result file into "x,y" text lines ("-" for stdout)."""
+    pairs = open_pair_file(binary_path, dtype)
+    outfile = sys.stdout.buffer if text_path == "-" else open(text_path, "wb")
+    try:
+        for lo in range(0, len(pairs), chunk_pairs):
+            lines = [f"{x},{y}\n" for x, y in pairs[lo:lo + chunk_pairs].tolist()]
+            outfile.write("".join(lines).encode("ascii"))
+    finally:
+        if outfile is not sys.stdout.buffer:
+            outfile.close()
+
+def main(argv=None):
+    """Converter between text and binary pair files."""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Convert number pair files between text and binary")
+    commands = parser.add_subparsers(dest="command", required=True)
+    for name, help_text in (("to-binary", "text pairs -> packed 64-bit binary"),
+                            ("to-text", "packed 64-bit binary -> text pairs")):
+        command = commands.add_parser(name, help=help_text)
+        command.add_argument("source", help='input file ("-" for stdin/stdout in text form)')
+        command.add_argument("target", help="output file")
+        command.add_argument("--dtype", choices=sorted(BINARY_DTYPES), default="int64")
+    args = parser.parse_args(argv)
+
+    if args.command == "to-binary":
+        text_to_binary(args.source, args.target, args.dtype)
+    else:
+        binary_to_text(args.source, args.target, args.dtype)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+"""
+A tiny GCD and LCM server for this computer (localhost only).
+
+Programs connect over TCP and send one pair per line, like "48 18"; the
+server answers each line with "48,18,6,144" (a,b,gcd,lcm), in order.
+Requests from all connections are collected into batches for a short
+moment and each batch is solved with one call, so many small requests
+cost about as much as one big one.
+
+Usage:
+    python lesson1_gcd_server.py serve --max-batch 1024 --max-delay 0.002
+    python lesson1_gcd_server.py load --connections 50 --requests 500
+    python lesson1_gcd_server.py sweep --max-batch 1 64 1024 --max-delay 0 0.001 0.005
+"""
+
+import argparse
+import asyncio
+import random
+import subprocess
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from lesson1_gcd_pipeline import gcd_and_lcm, parse_pair
+
+DEFAULT_HOST = "127.0.0.1"
+DEFAULT_PORT = 8765
+DEFAULT_MAX_BATCH = 1024
+DEFAULT_MAX_DELAY = 0.002  # seconds
+
+# Below this many pairs, NumPy's setup costs more than a plain loop
+VECTORIZE_MIN_BATCH = 32
+
+def compute_batch(pairs):
+    """
+    Solve a list of (a, b) pairs, returning a list of (gcd, lcm).
+
+    Uses find_gcd_lcm_batch (one Euclidean pass for both answers) when
+    NumPy is installed and the batch is big enough, and the plain loop
+    otherwise. The batch is shared by every client, so if NumPy can't take
+    one of the numbers the whole batch goes through the plain loop instead
+    of failing.
+    """
+    if len(pairs) >= VECTORIZE_MIN_BATCH:
+        try:
+            from lesson1_gcd_lcm import find_gcd_lcm_batch
+            a = [pair[0] for pair in pairs]
+            b = [pair[1] for pair in pairs]
+            gcds, lcms = find_gcd_lcm_batch(a, b, on_overflow="object")
+            return list(zip(gcds.tolist(), lcms.tolist()))
+        except (ImportError, TypeError, ValueError, OverflowError):
+            pass
+    return [gcd_and_lcm(a, b) for a, b in pairs]
+
+class BatchingGCDServer:
+    """
+    Collects requests into batches and solves each batch in one go.
+
+    A batch is sent off as soon as it has `max_batch` requests, or
+    `max_delay` seconds after its first request arrived, whichever comes
+    first. A bigger delay means bigger batches (more pairs per second)
+    but a longer wait for each answer.
+
+    Batches are solved in `executor` (a thread pool if None, or e.g. a
+    ProcessPoolExecutor), with up to `concurrency` batches at the same time.
+    """
+
+    def __init__(self, max_batch=DEFAULT_MAX_BATCH, max_delay=DEFAULT_MAX_DELAY,
+                 executor=None, concurrency=1):
+        self.max_batch = max_batch
+        self.max_delay = max_delay
+        self.executor = executor
+        self.concurrency = concurrency
+        self.requests = 0
+        self.batches = 0
+        self._queue = None
+        self._workers = []
+
+    def submit(self, a, b):
+        """Queue one pair; returns a future that becomes (gcd, lcm)."""
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((a, b, future))
+        return future
+
+    async def _next_batch(self):
+        """Wait for a first request, then gather more until full or out of time."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_delay
+        while len(batch) < self.max_batch:
+            try:
+                batch.append(self._queue.get_nowait())
+                continue
+            except asyncio.QueueEmpty:
+                pass
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _batch_worker(self):
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = await self._next_batch()
+            pairs = [(a, b) for a, b, _ in batch]
+            try:
+                results = await loop.run_in_executor(self.executor, compute_batch, pairs)
+            except Exception as e:
+                for *_, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            self.requests += len(batch)
+            self.batches += 1
+            for (*_, future), result in zip(batch, results):
+                if not future.done():
+                    future.set_result(result)
+
+    async def handle_client(self, reader, writer):
+        """Answer every line from one connection, in the order they came in."""
+        replies = asyncio.Queue()
+
+        async def write_replies():
+            while True:
+                item = await replies.get()
+                if item is None:
+                    return
+                a, b, future = item
+                try:
+                    g, lcm = await future
+                    line = f"{a},{b},{g},{lcm}\n"
+                except Exception as e:
+                    line = f"error: {e}\n"
+                writer.write(line.encode("ascii", "replace"))
+                if replies.empty():
+                    await writer.drain()
+
+        writer_task = asyncio.create_task(write_replies())
+        try:
+            async for line in reader:
+                text = line.decode("utf-8", "replace")
+                if not text.strip():
+                    continue
+                try:
+                    a, b = parse_pair(text)
+                    future = self.submit(a, b)
+                except ValueError as e:
+                    a = b = None
+                    future = asyncio.get_running_loop().create_future()
+                    future.set_exception(e)
+                await replies.put((a, b, future))
+        except ConnectionError:
+            pass
+        finally:
+            await replies.put(None)
+            try:
+                await writer_task
+                writer.close()
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def start(self, host=DEFAULT_HOST, port=DEFAULT_PORT):
+        """Start listening and batching; returns the asyncio server."""
+        self._queue = asyncio.Queue()
+        self._workers = [asyncio.create_task(self._batch_worker()) for _ in range(self.concurrency)]
+        return await asyncio.start_server(self.handle_client, host, port)
+
+    async def stop(self):
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+
+async def serve(host, port, max_batch, max_delay, workers):
+    """Run a server until Ctrl+C, printing the address it listens on."""
+    executor = ProcessPoolExecutor(workers) if workers else None
+    server = BatchingGCDServer(max_batch, max_delay, executor, concurrency=max(workers, 1))
+    listener = await server.start(host, port)
+    host, port = listener.sockets[0].getsockname()[:2]
+    print(f"listening on {host}:{port}", flush=True)
+    try:
+        async with listener:
+            await listener.serve_forever()
+    finally:
+        await server.stop()
+        if executor:
+            executor.shutdown()
+
+# ============================================================================
+# LOAD GENERATOR
+# ============================================================================
+
+def percentile(sorted_values, fraction):
+    """The value below which `fraction` of the (already sorted) values fall."""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(fraction * len(sorted_values)))
+    return sorted_values[index]
+
+async def _load_client(host, port, requests, latencies, rng):
+    """One connection sending a request and waiting for its answer, again and again."""
+    reader, writer = await asyncio.open_connection(host, port)
+    try:
+        for _ in range(requests):
+            a, b = rng.randint(1, 10**12), rng.randint(1, 10**12)
+            start = time.perf_counter()
+            writer.write(f"{a} {b}\n".encode("ascii"))
+            await writer.drain()
+            reply = await reader.readline()
+            latencies.append(time.perf_counter() - start)
+            if not reply or reply.startswith(b"error"):
+                raise RuntimeError(f"Bad reply from server: {reply!r}")
+    finally:
+        writer.close()
+        await writer.wait_closed()
+
+async def run_load(host=DEFAULT_HOST, port=DEFAULT_PORT, connections=50, requests=500, seed=2024):
+    """
+    Hit a running server from many connections at once.
+
+    Returns {"requests", "seconds", "throughput", "p50_ms", "p99_ms"}.
+    """
+    latencies = []
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _load_client(host, port, requests, latencies, random.Random(seed + i))
+        for i in range(connections)
+    ))
+    seconds = time.perf_counter() - start
+    latencies.sort()
+    return {
+        "requests": len(latencies),
+        "seconds": seconds,
+        "throughput": len(latencies) / seconds,
+        "p50_ms": percentile(latencies, 0.50) * 1e3,
+        "p99_ms": percentile(latencies, 0.99) * 1e3,
+    }
+
+def sweep(max_batches, max_delays, connections, requests, workers=0):
+    """
+    Start a fresh server for every batch setting, load it, and collect the numbers.
+
+    The server runs in its own process, so the load generator doesn't
+    steal time from it inside one event loop.
+    """
+    rows = []
+    for max_batch in max_batches:
+        for max_delay in max_delays:
+            server = subprocess.Popen(
+                [sys.executable, __file__, "serve", "--port", "0", "--max-batch", str(max_batch),
+                 "--max-delay", str(max_delay), "--workers", str(workers)],
+                stdout=subprocess.PIPE, text=True)
+            try:
+                address = server.stdout.readline().split()[-1]
+                host, port = address.rsplit(":", 1)
+                result = asyncio.run(run_load(host, int(port), connections, requests))
+            finally:
+                server.terminate()
+                server.wait()
+            rows.append({"max_batch": max_batch, "max_delay": max_delay, **result})
+    return rows
+
+def print_load_row(row):
+    settings = ""
+    if "max_batch" in row:
+        settings = f"{row['max_batch']:>9} {row['max_delay'] * 1e3:>9.1f}ms "
+    print(f"{settings}{row['throughput']:>12,.0f}/s {row['p50_ms']:>9.2f}ms {row['p99_ms']:>9.2f}ms")
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Local GCD/LCM server with request batching")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    def add_batch_options(command, many=False):
+        nargs = "+" if many else None
+        command.add_argument("--max-batch", type=int, nargs=nargs,
+                             default=[DEFAULT_MAX_BATCH] if many else DEFAULT_MAX_BATCH,
+                             help="most requests in one batch")
+        command.add_argument("--max-delay", type=float, nargs=nargs,
+                             default=[DEFAULT_MAX_DELAY] if many else DEFAULT_MAX_DELAY,
+                             help="seconds to wait for a batch to fill up")
+        command.add_argument("--workers", type=int, default=0,
+                             help="worker processes for batches (default: 0 = threads)")
+
+    def add_load_options(command):
+        command.add_argument("--connections", type=int, default=50, help="clients at the same time")
+        command.add_argument("--requests", type=int, default=500, help="requests per client")
+
+    serve_command = commands.add_parser("serve", help="run the server")
+    serve_command.add_argument("--host", default=DEFAULT_HOST)
+    serve_command.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_batch_options(serve_command)
+
+    load_command = commands.add_parser("load", help="measure a running server")
+    load_command.add_argument("--host", default=DEFAULT_HOST)
+    load_command.add_argument("--port", type=int, default=DEFAULT_PORT)
+    add_load_options(load_command)
+
+    sweep_command = commands.add_parser("sweep", help="compare batch settings (starts its own servers)")
+    add_batch_options(sweep_command, many=True)
+    add_load_options(sweep_command)
+
+    args = parser.parse_args(argv)
+    if args.command == "serve":
+        try:
+            asyncio.run(serve(args.host, args.port, args.max_batch, args.max_delay, args.workers))
+        except KeyboardInterrupt:
+            pass
+    elif args.command == "load":
+        print(f"{'throughput':>14} {'p50':>11} {'p99':>11}")
+        print_load_row(asyncio.run(run_load(args.host, args.port, args.connections, args.requests)))
+    elif args.command == "sweep":
+        print(f"{'max_batch':>9} {'max_delay':>11} {'throughput':>14} {'p50':>11} {'p99':>11}")
+        for row in sweep(args.max_batch, args.max_delay, args.connections, args.requests, args.workers):
+            print_load_row(row)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Grade a whole class of find_gcd/find_lcm submissions at once!
+
+Each submission is a .py file (usually a filled-in copy of
+lesson1_test_gcd_lcm.py) that defines find_gcd and find_lcm. Every
+submission runs in its own process with CPU, memory and wall-clock limits,
+so a `while` loop that never ends only costs its own time slot.
+
+Usage:
+    python lesson1_grader.py submissions/
+    python lesson1_grader.py alice.py bob.py --workers 8 --timeout 5 --csv grades.csv
+"""
+
+import argparse
+import contextlib
+import csv
+import functools
+import importlib.util
+import io
+import math
+import multiprocessing
+import os
+import random
+import signal
+import sys
+import time
+from collections import deque
+from multiprocessing.connection import wait
+
+from lesson1_test_gcd_lcm import BONUS_CASES, SPEED_TIME_FACTOR, TEST_CASES, run_pairs
+
+DEFAULT_TIMEOUT = 5.0      # wall-clock seconds per submission
+DEFAULT_MEMORY_MB = 512    # address space per submission
+
+# Grading hundreds of files needs smaller speed tests than the student
+# runner, so the budget floor is lower too
+GRADER_MIN_BUDGET = 0.25   # seconds
+
+@functools.lru_cache(maxsize=None)
+def grader_speed_cases():
+    """
+    Smaller versions of the speed tests, as (description, list of pairs).
+
+    Cached, so the parent builds them once and forked workers inherit them.
+    """
+    a, b = 1, 1
+    while len(str(b)) < 300:
+        a, b = b, a + b
+    rng = random.Random(2024)
+    return (
+        ("fibonacci", [(b, a)] * 30),
+        ("random", [(rng.randint(1, 10**6), rng.randint(1, 10**6)) for _ in range(5_000)]),
+    )
+
+class TooSlow(Exception):
+    """Raised inside a worker when a speed case runs past its budget."""
+
+@contextlib.contextmanager
+def time_limit(seconds):
+    """Interrupt the code inside after `seconds` (where SIGALRM exists)."""
+    if not hasattr(signal, "setitimer"):
+        yield
+        return
+
+    def stop(signum, frame):
+        raise TooSlow()
+
+    previous = signal.signal(signal.SIGALRM, stop)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+def reference_budgets():
+    """(time budget, expected checksum) for each grader speed case."""
+    from lesson1_gcd_lcm import find_gcd, find_lcm
+
+    budgets = []
+    for _, pairs in grader_speed_cases():
+        seconds, checksum = run_pairs(find_gcd, find_lcm, pairs)
+        budgets.append((max(SPEED_TIME_FACTOR * seconds, GRADER_MIN_BUDGET), checksum))
+    return budgets
+
+def find_submissions(paths):
+    """Expand directories into the .py files inside them."""
+    found = []
+    for path in paths:
+        if os.path.isdir(path):
+            found.extend(os.path.join(path, name) for name in sorted(os.listdir(path))
+                         if name.endswith(".py"))
+        else:
+            found.append(path)
+    return found
+
+def load_submission(path):
+    """Import a submission file as a fresh module, hiding anything it prints."""
+    name = "submission_" + os.path.splitext(os.path.basename(path))[0]
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    with contextlib.redirect_stdout(io.StringIO()):
+        spec.loader.exec_module(module)
+    return module
+
+def _limit_resources(cpu_seconds, memory_mb):
+    """Cap CPU time and memory for this process (only on Unix-like systems)."""
+    try:
+        import resource
+    except ImportError:
+        return
+    limits = [(resource.RLIMIT_CPU, math.ceil(cpu_seconds))]
+    if memory_mb:
+        limits.append((resource.RLIMIT_AS, memory_mb * 1024 * 1024))
+    for kind, value in limits:
+        try:
+            resource.setrlimit(kind, (value, value))
+        except (ValueError, OSError):
+            pass
+
+def count_passed(gcd, lcm, cases):
+    """How many (a, b, expected_gcd, expected_lcm) cases come out right."""
+    passed = 0
+    for a, b, expected_gcd, expected_lcm in cases:
+        try:
+            if gcd(a, b) == expected_gcd and lcm(a, b) == expected_lcm:
+                passed += 1
+        except Exception:
+            pass
+    return passed
+
+def _grade_worker(path, budgets, cpu_seconds, memory_mb, conn):
+    """
+    Grade one submission (this runs in its own process).
+
+    Results are sent to the parent as soon as each part is done, so if the
+    submission hangs later we still know how far it got.
+    """
+    _limit_resources(cpu_seconds, memory_mb)
+    sys.stdout = sys.stderr = open(os.devnull, "w")
+    try:
+        module = load_submission(path)
+        gcd, lcm = module.find_gcd, module.find_lcm
+    except BaseException as e:
+        conn.send(("error", f"{type(e).__name__}: {e}"))
+        return
+
+    conn.send(("tests", count_passed(gcd, lcm, TEST_CASES)))
+    conn.send(("bonus", count_passed(gcd, lcm, BONUS_CASES)))
+    for (_, pairs), (budget, expected) in zip(grader_speed_cases(), budgets):
+        # Stop a slow case at its budget instead of waiting for the timeout
+        try:
+            with time_limit(budget):
+                seconds, checksum = run_pairs(gcd, lcm, pairs)
+            fast_and_right = checksum == expected and seconds <= budget
+        except Exception:
+            fast_and_right = False
+        conn.send(("speed", fast_and_right))
+    conn.send(("done", None))
+
+def _new_result(path):
+    return {"submission": os.path.basename(path), "status": "running",
+            "tests": 0, "bonus": 0, "speed": 0, "seconds": 0.0, "detail": ""}
+
+def _apply_message(result, kind, value):
+    """Record one message from a worker. Returns True when the worker is finished."""
+    if kind == "error":
+        result["status"], result["detail"] = "error", value
+        return True
+    if kind == "done":
+        result["status"] = "ok"
+        return True
+    if kind == "speed":
+        result["speed"] += bool(value)
+    else:
+        result[kind] = value
+    return False
+
+def _exit_status(process):
+    """Name what happened to a worker that stopped without saying it was done."""
+    if process.exitcode == -getattr(signal, "SIGXCPU", -1):
+        return "cpu limit"
+    if process.exitcode == -signal.SIGKILL:
+        return "killed"
+    return "crashed"
+
+def grade_all(paths, workers=None, timeout=DEFAULT_TIMEOUT, memory_mb=DEFAULT_MEMORY_MB,
+              progress=None):
+    """
+    Grade every submission, at most `workers` at the same time.
+
+    Returns one result dict per submission, in the same order as `paths`.
+    `progress`, if given, is called with each result when it finishes.
+    """
+    workers = workers or os.cpu_count() or 1
+    budgets = reference_budgets()
+    # fork starts a worker in milliseconds, with this module already imported
+    methods = multiprocessing.get_all_start_methods()
+    ctx = multiprocessing.get_context("fork" if "fork" in methods else None)
+
+    results = [_new_result(path) for path in paths]
+    waiting = deque(range(len(paths)))
+    running = {}  # connection -> (index, process, start, deadline)
+
+    def finish(conn, status=None):
+        index, process, start, _ = running.pop(conn)
+        if status == "timeout":
+            process.kill()
+        process.join()
+        conn.close()
+        result = results[index]
+        result["seconds"] = time.perf_counter() - start
+        if result["status"] == "running":
+            result["status"] = status or _exit_status(process)
+        if progress:
+            progress(result)
+
+    while waiting or running:
+        while waiting and len(running) < workers:
+            index = waiting.popleft()
+            receive, send = ctx.Pipe(duplex=False)
+            process = ctx.Process(target=_grade_worker,
+                                  args=(paths[index], budgets, timeout, memory_mb, send),
+                                  daemon=True)
+            process.start()
+            send.close()
+            start = time.perf_counter()
+            running[receive] = (index, process, start, start + timeout)
+
+        next_deadline = min(deadline for *_, deadline in running.values())
+        for conn in wait(list(running), timeout=max(0.0, next_deadline - time.perf_counter())):
+            index = running[conn][0]
+            try:
+                while conn.poll():
+                    if _apply_message(results[index], *conn.recv()):
+                        finish(conn)
+                        break
+            except (EOFError, OSError):
+                finish(conn)
+
+        now = time.perf_counter()
+        for conn in [c for c, (*_, deadline) in running.items() if deadline <= now]:
+            finish(conn, "timeout")
+
+    return results
+
+def print_results(results):
+    """Print the grades as a table."""
+    speed_total = len(grader_speed_cases())
+    print(f"{'submission':<30} {'status':<10} {'tests':>6} {'bonus':>6} {'speed':>6} {'time':>7}")
+    for r in results:
+        print(f"{r['submission']:<30} {r['status']:<10} "
+              f"{r['tests']:>3}/{len(TEST_CASES):<2} {r['bonus']:>3}/{len(BONUS_CASES):<2} "
+              f"{r['speed']:>3}/{speed_total:<2} {r['seconds']:>6.2f}s")
+        if r["detail"]:
+            print(f"    {r['detail']}")
+
+def save_csv(results, path):
+    """Save the grades as a CSV file for a spreadsheet."""
+    with open(path, "w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=list(results[0]) if results else ["submission"])
+        writer.writeheader()
+        writer.writerows(results)
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Grade many find_gcd/find_lcm submissions")
+    parser.add_argument("paths", nargs="+", help="submission .py files or folders of them")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="submissions graded at once (default: one per core)")
+    parser.add_argument("--timeout", type=float, default=DEFAULT_TIMEOUT,
+                        help=f"wall and CPU seconds per submission (default: {DEFAULT_TIMEOUT})")
+    parser.add_argument("--memory-mb", type=int, default=DEFAULT_MEMORY_MB,
+                        help=f"memory limit per submission, 0 for none (default: {DEFAULT_MEMORY_MB})")
+    parser.add_argument("--csv", help="also save the grades to this CSV file")
+    args = parser.parse_args(argv)
+
+    paths = find_submissions(args.paths)
+    start = time.perf_counter()
+    results = grade_all(paths, args.workers, args.timeout, args.memory_mb)
+    seconds = time.perf_counter() - start
+
+    print_results(results)
+    print(f"\n📝 Graded {len(results)} submissions in {seconds:.1f}s")
+    if args.csv:
+        save_csv(results, args.csv)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,18 @@
+#!/usr/bin/env python3
+"""
+A quick way to start the GCD and LCM lesson from the command line.
+
+Python compiles the file you run from scratch every time, but a module
+that file imports is compiled once and saved in __pycache__.
+lesson1_gcd_lcm.py is a big file, so starting it through this tiny
+launcher skips about 10 ms of compiling on every run:
+
+    python lesson1_run.py compute 48 18
+
+It takes exactly the same commands as `python lesson1_gcd_lcm.py`.
+"""
+
+from lesson1_gcd_lcm import main
+
+if __name__ == "__main__":
+    main()
@@ -5,6 +5,31 @@ Kids should implement their own find_gcd and find_lcm functions,
 then run this test to see if they're correct.
 """
 
+import multiprocessing
+import random
+import time
+
+# Test cases with known answers (also used by lesson1_grader.py)
+TEST_CASES = [
+    (12, 18, 6, 36),      # (num1, num2, expected_gcd, expected_lcm)
+    (8, 12, 4, 24),
+    (15, 25, 5, 75),
+    (9, 16, 1, 144),
+    (35, 77, 7, 385),
+    (48, 18, 6, 144),
+    (100, 75, 25, 300),
+    (7, 13, 1, 91),
+    (24, 36, 12, 72),
+    (50, 125, 25, 250)
+]
+
+BONUS_CASES = [
+    (0, 5, 5, 0),         # Edge case: one number is 0
+    (1, 1, 1, 1),         # Edge case: same numbers
+    (17, 23, 1, 391),     # Prime numbers
+    (1000, 1001, 1, 1001000),  # Large numbers
+]
+
 def test_gcd_lcm_functions():
     """
     Test function to check if the kids' GCD and LCM functions work correctly.
@@ -13,18 +38,7 @@ def test_gcd_lcm_functions():
     """
     
     # Test cases with known answers
-    test_cases = [
-        (12, 18, 6, 36),      # (num1, num2, expected_gcd, expected_lcm)
-        (8, 12, 4, 24),
-        (15, 25, 5, 75),
-        (9, 16, 1, 144),
-        (35, 77, 7, 385),
-        (48, 18, 6, 144),
-        (100, 75, 25, 300),
-        (7, 13, 1, 91),
-        (24, 36, 12, 72),
-        (50, 125, 25, 250)
-    ]
+    test_cases = TEST_CASES
     
     print("🧪 Testing your GCD and LCM functions...")
     print("=" * 50)
@@ -83,12 +97,7 @@ def run_bonus_tests():
     print("\n🌟 BONUS CHALLENGE TESTS 🌟")
     print("=" * 30)
     
-    bonus_cases = [
-        (0, 5, 5, 0),         # Edge case: one number is 0
-        (1, 1, 1, 1),         # Edge case: same numbers
-        (17, 23, 1, 391),     # Prime numbers
-        (1000, 1001, 1, 1001000),  # Large numbers
-    ]
+    bonus_cases = BONUS_CASES
     
     for i, (num1, num2, expected_gcd, expected_lcm) in enumerate(bonus_cases, 1):
         print(f"\nBonus Test {i}: Numbers {num1} and {num2}")
@@ -106,6 +115,98 @@ def run_bonus_tests():
         except Exception as e:
             print(f"  ❌ Error: {e}")
 
+# ============================================================================
+# SPEED TESTS: is your function fast enough for really big numbers?
+# ============================================================================
+
+# Your functions may be up to this many times slower than the lesson's
+# Euclidean Algorithm, but never need to finish faster than SPEED_MIN_BUDGET.
+# Checking every number up to min(a, b) is millions of times slower on these
+# inputs, so it runs out of time no matter how fast the computer is.
+SPEED_TIME_FACTOR = 10
+SPEED_MIN_BUDGET = 2.0  # seconds
+
+def speed_case(index):
+    """
+    The big inputs for the speed tests, as (description, list of pairs).
+
+    They are rebuilt from a fixed seed whenever they're needed, so a helper
+    process can make exactly the same pairs without us sending them over.
+    """
+    if index == 0:
+        # Consecutive Fibonacci numbers are the slowest inputs for Euclid
+        a, b = 1, 1
+        while len(str(b)) < 300:
+            a, b = b, a + b
+        return "300-digit Fibonacci numbers, 1,000 times", [(b, a)] * 1000
+    rng = random.Random(2024)
+    pairs = [(rng.randint(1, 10**6), rng.randint(1, 10**6)) for _ in range(10**6)]
+    return "1,000,000 random pairs up to 1,000,000", pairs
+
+SPEED_CASE_COUNT = 2
+
+def run_pairs(gcd, lcm, pairs):
+    """Run gcd and lcm on every pair; returns (seconds, checksum of all answers)."""
+    start = time.perf_counter()
+    checksum = 0
+    for a, b in pairs:
+        checksum += gcd(a, b) + lcm(a, b)
+    return time.perf_counter() - start, checksum
+
+def _time_your_functions(index, answers):
+    """Runs in a helper process, so a too-slow function can be stopped."""
+    try:
+        answers.put(("ok",) + run_pairs(find_gcd, find_lcm, speed_case(index)[1]))
+    except Exception as e:
+        answers.put(("error", f"{type(e).__name__}: {e}", None))
+
+def run_speed_tests():
+    """
+    Timed tests: your functions against the lesson's Euclidean Algorithm.
+
+    Both get the same big inputs. If yours takes longer than its time
+    budget, it is stopped and the test fails, because it would be far too
+    slow for big numbers even if the answers are right.
+    """
+    from lesson1_gcd_lcm import find_gcd as reference_gcd, find_lcm as reference_lcm
+
+    print("\n⏱️  SPEED TESTS ⏱️")
+    print("=" * 30)
+
+    passed = 0
+    for index in range(SPEED_CASE_COUNT):
+        description, pairs = speed_case(index)
+        print(f"\nSpeed Test {index + 1}: {description}")
+
+        reference_time, expected = run_pairs(reference_gcd, reference_lcm, pairs)
+        budget = max(SPEED_TIME_FACTOR * reference_time, SPEED_MIN_BUDGET)
+        print(f"  Lesson's Euclid: {reference_time:.3f}s | Your time budget: {budget:.1f}s")
+
+        answers = multiprocessing.Queue()
+        helper = multiprocessing.Process(target=_time_your_functions, args=(index, answers))
+        helper.start()
+        try:
+            status, detail, checksum = answers.get(timeout=budget)
+        except Exception:
+            status, detail, checksum = "timeout", None, None
+        helper.terminate()
+        helper.join()
+
+        if status == "timeout":
+            print(f"  ❌ Still running after {budget:.1f}s, so we stopped it.")
+            print("  💡 Hint: checking every number one by one is too slow for big numbers.")
+            print("     Try the Euclidean Algorithm with remainders (%)!")
+        elif status == "error":
+            print(f"  ❌ Error in your functions: {detail}")
+        elif checksum != expected:
+            print(f"  ❌ Finished in {detail:.3f}s, but some answers were wrong.")
+        else:
+            print(f"  Your time: {detail:.3f}s ({detail / reference_time:.1f}x the lesson's time) ✅")
+            passed += 1
+
+    print(f"\n🏁 Speed Score: {passed}/{SPEED_CASE_COUNT} speed tests passed!")
+    return passed == SPEED_CASE_COUNT
+
 # ============================================================================
 # KIDS: ADD YOUR FUNCTIONS HERE!
 # ============================================================================
@@ -140,6 +241,7 @@ if __name__ == "__main__":
         print("\n✅ Functions found! Running tests...")
         test_gcd_lcm_functions()
         run_bonus_tests()
+        run_speed_tests()
     except NameError:
         print("\n❌ Functions not found yet!")
         print("Please implement find_gcd and find_lcm functions above the test section.")
@@ -0,0 +1,251 @@
+#!/usr/bin/env python3
+"""
+How many numbers share no factor with N? Euler's totient!
+
+phi(N) counts the numbers 1 <= k <= N with GCD(k, N) = 1.
+Example: phi(12) = 4, because only 1, 5, 7 and 11 share nothing with 12.
+
+Looping find_gcd over every k <= N answers this, but there is a much
+faster way: every k has GCD(k, N) = d for some divisor d of N, and
+k = d × j with GCD(j, N/d) = 1. So the answers only depend on the
+divisors of N and phi of each N/d, and a table of phi answers them all.
+
+Usage:
+    python lesson1_totient.py 36                 # phi, the GCD sum and GCD(k, 36) for every k
+    python lesson1_totient.py 36 --with-gcd 4    # every k <= 36 with GCD(k, 36) = 4
+    python lesson1_totient.py 36 --coprime-upto 20
+"""
+
+import argparse
+import mmap
+import os
+from array import array
+
+from lesson1_factorize import DEFAULT_SIEVE_LIMIT, SmallestPrimeFactorSieve, factorize
+
+_TOTIENT_MAGIC = b"PHI1"
+_TOTIENT_HEADER_SIZE = 16  # magic (4 bytes) + padding (4) + limit (8, little-endian)
+
+class TotientSieve:
+    """
+    Tables of phi(n) and the smallest prime factor of every n up to `limit`.
+
+    Both tables are arrays of 32-bit unsigned ints (8 bytes per number),
+    stored one after the other in a file so load() can memory-map them,
+    just like SmallestPrimeFactorSieve. `primes` is the smallest prime
+    factor sieve, so anything it can do (like factorize) works here too.
+    """
+
+    def __init__(self, limit, spf_table, phi_table):
+        self.limit = limit
+        self.primes = SmallestPrimeFactorSieve(limit, spf_table)
+        self._spf = spf_table
+        self._phi = phi_table
+
+    @classmethod
+    def build(cls, limit):
+        """Build both tables; phi takes one step per number (a linear sieve)."""
+        spf = SmallestPrimeFactorSieve.build(limit)._table
+        phi = array("I", bytes(4 * (limit + 1)))
+        if limit >= 1:
+            phi[1] = 1
+        for n in range(2, limit + 1):
+            p = spf[n]
+            m = n // p
+            # phi(p × m) = phi(m) × p if p already divides m, else phi(m) × (p - 1)
+            phi[n] = phi[m] * p if spf[m] == p else phi[m] * (p - 1)
+        return cls(limit, spf, phi)
+
+    def save(self, path):
+        """Write both tables to a file that load() can memory-map later."""
+        with open(path, "wb") as f:
+            f.write(_TOTIENT_MAGIC + bytes(4) + self.limit.to_bytes(8, "little"))
+            array("I", self._spf).tofile(f)
+            array("I", self._phi).tofile(f)
+
+    @classmethod
+    def load(cls, path):
+        """Memory-map tables written by save() (on a machine with the same byte order)."""
+        with open(path, "rb") as f:
+            mapped = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        header = mapped[:_TOTIENT_HEADER_SIZE]
+        limit = int.from_bytes(header[8:16], "little")
+        size = 4 * (limit + 1)
+        if header[:4] != _TOTIENT_MAGIC or len(mapped) != _TOTIENT_HEADER_SIZE + 2 * size:
+            mapped.close()
+            raise ValueError(f"{path} is not a totient sieve file")
+        tables = memoryview(mapped)[_TOTIENT_HEADER_SIZE:]
+        return cls(limit, tables[:size].cast("I"), tables[size:].cast("I"))
+
+    @classmethod
+    def cached(cls, limit, directory):
+        """Load the sieve for `limit` from `directory`, building and saving it the first time."""
+        path = os.path.join(directory, f"phi_{limit}.bin")
+        try:
+            return cls.load(path)
+        except (FileNotFoundError, ValueError):
+            pass
+        sieve = cls.build(limit)
+        os.makedirs(directory, exist_ok=True)
+        # Write to a temporary name first, so nobody ever maps a half-written file
+        temporary = f"{path}.{os.getpid()}.tmp"
+        sieve.save(temporary)
+        os.replace(temporary, path)
+        return sieve
+
+    def factorize(self, n):
+        """Prime factors of n >= 1 as {prime: exponent}; big n goes to lesson1_factorize."""
+        if n <= self.limit:
+            return self.primes.factorize(n)
+        return factorize(n, self.primes)
+
+    def phi(self, n):
+        """Euler's totient: how many 1 <= k <= n have GCD(k, n) = 1."""
+        _check_positive(n)
+        if n <= self.limit:
+            return self._phi[n]
+        result = n
+        for p in self.factorize(n):
+            result = result // p * (p - 1)
+        return result
+
+    def divisors(self, n):
+        """Every divisor of n, smallest first."""
+        _check_positive(n)
+        divisors = [1]
+        for p, e in self.factorize(n).items():
+            divisors = [d * p ** k for d in divisors for k in range(e + 1)]
+        return sorted(divisors)
+
+    def coprime_count(self, n, upto=None):
+        """
+        How many 1 <= k <= upto (default n) have GCD(k, n) = 1.
+
+        For upto = n this is phi(n). Otherwise we count with inclusion-
+        exclusion over the primes of n: take all numbers, remove the
+        multiples of each prime, add back the multiples of each pair of
+        primes, and so on. That is 2^(number of primes of n) steps.
+        """
+        _check_positive(n)
+        if upto is None or upto == n:
+            return self.phi(n)
+        if upto < 1:
+            return 0
+        count = 0
+        products = [(1, 1)]  # (product of some primes of n, +1 or -1)
+        for p in self.factorize(n):
+            products += [(d * p, -sign) for d, sign in products]
+        for d, sign in products:
+            count += sign * (upto // d)
+        return count
+
+    def gcd_counts(self, n):
+        """
+        {d: how many 1 <= k <= n have GCD(k, n) = d} for every divisor d.
+
+        Example: gcd_counts(6) -> {1: 2, 2: 2, 3: 1, 6: 1}
+        (GCD(k, 6) for k = 1..6 is 1, 2, 3, 2, 1, 6)
+        """
+        return {d: self.phi(n // d) for d in self.divisors(n)}
+
+    def gcd_sum(self, n):
+        """
+        GCD(1, n) + GCD(2, n) + ... + GCD(n, n), Pillai's function.
+
+        Each divisor d shows up phi(n / d) times, so this is the sum of
+        d × phi(n / d) over the divisors d of n.
+        """
+        return sum(d * count for d, count in self.gcd_counts(n).items())
+
+    def count_with_gcd(self, n, d):
+        """How many 1 <= k <= n have GCD(k, n) = d."""
+        _check_positive(n)
+        if d < 1 or n % d:
+            return 0
+        return self.phi(n // d)
+
+    def numbers_with_gcd(self, n, d):
+        """
+        Every 1 <= k <= n with GCD(k, n) = d, smallest first.
+
+        These are k = d × j where GCD(j, n / d) = 1, so we cross out the
+        multiples of each prime of n / d (a few slice assignments) and keep
+        what is left. Numbers without that GCD are never looked at one by one.
+        """
+        _check_positive(n)
+        if d < 1 or n % d:
+            return []
+        m = n // d
+        keep = bytearray([1]) * (m + 1)
+        keep[0] = 0
+        for p in self.factorize(m):
+            keep[p::p] = bytes(len(range(p, m + 1, p)))
+        return [d * j for j in _positions(keep)]
+
+def _positions(flags):
+    """Indexes of the nonzero bytes in a bytearray."""
+    position = flags.find(1)
+    while position != -1:
+        yield position
+        position = flags.find(1, position + 1)
+
+def _check_positive(n):
+    if n < 1:
+        raise ValueError(f"Need a positive whole number, got {n}")
+
+_default_sieve = None
+
+def get_totient_sieve(limit=DEFAULT_SIEVE_LIMIT, cache_dir=None):
+    """
+    The shared totient sieve, built (or loaded from cache_dir) the first
+    time it's needed. Asking for a bigger limit replaces it.
+    """
+    global _default_sieve
+    if _default_sieve is None or _default_sieve.limit < limit:
+        if cache_dir:
+            _default_sieve = TotientSieve.cached(limit, cache_dir)
+        else:
+            _default_sieve = TotientSieve.build(limit)
+    return _default_sieve
+
+def _positive_int(text):
+    """argparse type: a whole number of at least 1."""
+    try:
+        value = int(text)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"{text!r} is not a whole number")
+    if value < 1:
+        raise argparse.ArgumentTypeError(f"need a positive whole number, got {value}")
+    return value
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Euler's totient and GCD(k, N) for every k <= N")
+    parser.add_argument("number", type=_positive_int)
+    parser.add_argument("--with-gcd", type=_positive_int, metavar="D", help="list every k <= N with GCD(k, N) = D")
+    parser.add_argument("--coprime-upto", type=int, metavar="X", help="count k <= X with GCD(k, N) = 1")
+    parser.add_argument("--limit", type=_positive_int, default=DEFAULT_SIEVE_LIMIT, help="sieve size")
+    parser.add_argument("--cache-dir", help="save the sieve here and memory-map it next time")
+    args = parser.parse_args(argv)
+
+    n = args.number
+    if args.with_gcd is not None and n % args.with_gcd:
+        parser.error(f"--with-gcd {args.with_gcd} does not divide {n}, so no k has GCD(k, {n}) = {args.with_gcd}")
+    sieve = get_totient_sieve(min(args.limit, max(n, 1)), args.cache_dir)
+    if args.with_gcd is not None:
+        found = sieve.numbers_with_gcd(n, args.with_gcd)
+        print(f"{len(found)} numbers k <= {n} have GCD(k, {n}) = {args.with_gcd}:")
+        print(" ".join(map(str, found)))
+        return
+    if args.coprime_upto is not None:
+        count = sieve.coprime_count(n, args.coprime_upto)
+        print(f"{count} numbers k <= {args.coprime_upto} have GCD(k, {n}) = 1")
+        return
+
+    print(f"phi({n}) = {sieve.phi(n)}  (numbers <= {n} that share no factor with it)")
+    print(f"GCD(1, {n}) + ... + GCD({n}, {n}) = {sieve.gcd_sum(n)}")
+    print()
+    for d, count in sieve.gcd_counts(n).items():
+        print(f"GCD(k, {n}) = {d}: {count} numbers")
+
+if __name__ == "__main__":
+    main()
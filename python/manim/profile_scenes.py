@@ -0,0 +1,216 @@
+#!/usr/bin/env python3
+"""
+Which animation takes the longest to render? Let's measure it!
+
+Renders scenes with every self.play(), self.wait() and self.clear() call
+timed. For each call it records the wall time, how many frames were
+written, how many mobjects were on screen and the peak Python memory,
+then prints the calls slowest first.
+
+Usage:
+    python profile_scenes.py                                  # SimpleManimDemo, low quality
+    python profile_scenes.py PatternsSection --quality m --report report.txt
+    python profile_scenes.py --trace trace.json               # open in chrome://tracing or Perfetto
+
+Rendering with the profiler is slower than normal (memory tracking has
+a cost; use --no-memory to skip it), so compare calls with each other,
+not with normal render times. Manim's partial movie cache is turned off,
+so every call really renders.
+"""
+
+import argparse
+import importlib.util
+import json
+import os
+import sys
+import time
+import tracemalloc
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_FILE = os.path.join(HERE, "simple_demo.py")
+
+# manim's -q letters as (pixel height, pixel width, frames per second)
+QUALITIES = {"l": (480, 854, 15), "m": (720, 1280, 30), "h": (1080, 1920, 60),
+             "p": (1440, 2560, 60), "k": (2160, 3840, 60)}
+
+def describe_call(kind, args):
+    """A short name for one call, like "play Write(Text), FadeOut(Circle)"."""
+    if kind != "play":
+        return f"{kind}({', '.join(repr(arg) for arg in args)})"
+    parts = []
+    for arg in args:
+        mobject = getattr(arg, "mobject", None)
+        name = "animate" if type(arg).__name__ == "_AnimationBuilder" else type(arg).__name__
+        parts.append(f"{name}({type(mobject).__name__})" if mobject is not None else name)
+    return "play " + ", ".join(parts)
+
+class SceneProfiler:
+    """
+    Collects one record per play/wait/clear call of the scenes it wraps.
+
+    Each record is a dict with: scene, kind, call, line (method:line in
+    the scene file), start (seconds since the profiler was made), seconds, frames,
+    mobjects and family (mobjects on screen after the call, counting
+    submobjects for family) and peak_bytes (None without memory tracking).
+    """
+
+    def __init__(self, track_memory=True):
+        self.track_memory = track_memory
+        self.records = []
+        self.scene_seconds = {}
+        self._origin = time.perf_counter()
+        self._measuring = False
+
+    def wrap(self, scene_class):
+        """A subclass of scene_class whose play, wait and clear are measured."""
+        profiler = self
+
+        class Profiled(scene_class):
+            def setup(self):
+                super().setup()
+                add_frame = self.renderer.add_frame
+
+                # Count every frame the renderer writes (wait() writes many at once)
+                def counting_add_frame(frame, num_frames=1):
+                    self._profile_frames += num_frames
+                    return add_frame(frame, num_frames)
+
+                self._profile_frames = 0
+                self.renderer.add_frame = counting_add_frame
+
+            def play(self, *args, **kwargs):
+                return profiler.measure(self, "play", args, lambda: super(Profiled, self).play(*args, **kwargs))
+
+            def wait(self, *args, **kwargs):
+                return profiler.measure(self, "wait", args, lambda: super(Profiled, self).wait(*args, **kwargs))
+
+            def clear(self):
+                return profiler.measure(self, "clear", (), lambda: super(Profiled, self).clear())
+
+        Profiled.__name__ = Profiled.__qualname__ = scene_class.__name__
+        return Profiled
+
+    def measure(self, scene, kind, args, call):
+        # Scene.wait() works by calling self.play(Wait()), which shouldn't count twice
+        if self._measuring:
+            return call()
+        self._measuring = True
+        # Two frames up: Profiled.play, then the scene method that called it
+        caller = sys._getframe(2)
+        frames_before = scene._profile_frames
+        if self.track_memory:
+            tracemalloc.reset_peak()
+        start = time.perf_counter()
+        try:
+            return call()
+        finally:
+            seconds = time.perf_counter() - start
+            self._measuring = False
+            self.records.append({
+                "scene": type(scene).__name__,
+                "kind": kind,
+                "call": describe_call(kind, args),
+                "line": f"{caller.f_code.co_name}:{caller.f_lineno}",
+                "start": start - self._origin,
+                "seconds": seconds,
+                "frames": scene._profile_frames - frames_before,
+                "mobjects": len(scene.mobjects),
+                "family": sum(len(m.get_family()) for m in scene.mobjects),
+                "peak_bytes": tracemalloc.get_traced_memory()[1] if self.track_memory else None,
+            })
+
+    def render(self, scene_class, quality="l", media_dir=None):
+        """Render one scene with profiling switched on."""
+        from manim import tempconfig
+
+        height, width, fps = QUALITIES[quality]
+        options = {"pixel_height": height, "pixel_width": width, "frame_rate": fps,
+                   "disable_caching": True}
+        if media_dir:
+            options["media_dir"] = media_dir
+        if self.track_memory:
+            tracemalloc.start()
+        start = time.perf_counter()
+        try:
+            with tempconfig(options):
+                self.wrap(scene_class)().render()
+        finally:
+            self.scene_seconds[scene_class.__name__] = time.perf_counter() - start
+            if self.track_memory:
+                tracemalloc.stop()
+
+    def report(self, top=None):
+        """The records as a text table, slowest first, with totals per kind of call."""
+        total = sum(self.scene_seconds.values()) or 1.0
+        measured = sum(r["seconds"] for r in self.records)
+        lines = [f"{'seconds':>8} {'share':>6} {'frames':>6} {'ms/frame':>8} {'mobjects':>9} "
+                 f"{'peak MB':>8}  {'where':<34} call"]
+        for r in sorted(self.records, key=lambda r: r["seconds"], reverse=True)[:top]:
+            per_frame = f"{r['seconds'] / r['frames'] * 1e3:8.1f}" if r["frames"] else f"{'-':>8}"
+            peak = f"{r['peak_bytes'] / 2**20:8.1f}" if r["peak_bytes"] is not None else f"{'-':>8}"
+            mobjects = f"{r['mobjects']}/{r['family']}"
+            lines.append(f"{r['seconds']:8.3f} {r['seconds'] / total:6.1%} {r['frames']:>6} {per_frame} "
+                         f"{mobjects:>9}  {peak}  {r['scene'] + '.' + r['line']:<34} {r['call']}")
+
+        lines.append("")
+        for kind in ("play", "wait", "clear"):
+            chosen = [r for r in self.records if r["kind"] == kind]
+            seconds = sum(r["seconds"] for r in chosen)
+            frames = sum(r["frames"] for r in chosen)
+            lines.append(f"{kind:>6}: {len(chosen):>4} calls {seconds:8.3f}s {seconds / total:6.1%} "
+                         f"{frames:>6} frames")
+        lines.append(f"{'other':>6}: {'':>10} {total - measured:8.3f}s {(total - measured) / total:6.1%}"
+                     f"  (setup, text, writing the movie file)")
+        lines.append(f"{'total':>6}: {len(self.records):>4} calls {total:8.3f}s")
+        return "\n".join(lines)
+
+    def chrome_trace(self):
+        """The records in Chrome's trace event format (one row per scene)."""
+        rows = {name: i for i, name in enumerate(self.scene_seconds)}
+        events = [{"name": "thread_name", "ph": "M", "pid": 1, "tid": tid, "args": {"name": name}}
+                  for name, tid in rows.items()]
+        for r in self.records:
+            events.append({
+                "name": r["call"], "cat": r["kind"], "ph": "X", "pid": 1,
+                "tid": rows.get(r["scene"], 0),
+                "ts": r["start"] * 1e6, "dur": r["seconds"] * 1e6,
+                "args": {key: r[key] for key in ("line", "frames", "mobjects", "family", "peak_bytes")},
+            })
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+def load_scene_classes(path, names):
+    """Import a scene file and return the scene classes with these names."""
+    sys.path.insert(0, os.path.dirname(os.path.abspath(path)))
+    spec = importlib.util.spec_from_file_location(os.path.splitext(os.path.basename(path))[0], path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return [getattr(module, name) for name in names]
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Profile the animation calls of Manim scenes")
+    parser.add_argument("scenes", nargs="*", default=["SimpleManimDemo"], help="scene class names")
+    parser.add_argument("--file", default=DEFAULT_FILE, help="scene file (default: simple_demo.py)")
+    parser.add_argument("--quality", choices=list(QUALITIES), default="l")
+    parser.add_argument("--top", type=int, default=None, help="only show the slowest N calls")
+    parser.add_argument("--no-memory", action="store_true", help="skip peak memory (renders faster)")
+    parser.add_argument("--report", help="also save the report to this text file")
+    parser.add_argument("--trace", help="save a Chrome trace JSON file")
+    parser.add_argument("--media-dir", help="where manim writes its videos")
+    args = parser.parse_args(argv)
+
+    profiler = SceneProfiler(track_memory=not args.no_memory)
+    for scene_class in load_scene_classes(args.file, args.scenes):
+        profiler.render(scene_class, args.quality, args.media_dir)
+
+    report = profiler.report(args.top)
+    print(report)
+    if args.report:
+        with open(args.report, "w", encoding="utf-8") as f:
+            f.write(report + "\n")
+    if args.trace:
+        with open(args.trace, "w", encoding="utf-8") as f:
+            json.dump(profiler.chrome_trace(), f)
+        print(f"\n💾 Chrome trace saved to {args.trace}")
+
+if __name__ == "__main__":
+    main()
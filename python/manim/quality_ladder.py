@@ -0,0 +1,225 @@
+#!/usr/bin/env python3
+"""
+Render a scene ONCE and get a video at every quality!
+
+Normally each quality (-ql, -qm, -qh) is a separate manim run: the whole
+scene is drawn again at every resolution, saved as partial movie files,
+then glued together. This script draws every frame once, at the biggest
+size and frame rate asked for, and pipes the raw pixels straight into
+one ffmpeg process per quality. Each ffmpeg shrinks the frames (and drops
+some for the lower frame rates) while the scene is still rendering, and
+nothing but the finished videos is written to disk.
+
+Usage:
+    python quality_ladder.py                         # SimpleManimDemo at l, m and h
+    python quality_ladder.py PatternsSection --quality l h
+    python quality_ladder.py --compare               # also time one manim run per quality
+
+Works with manim's default Cairo renderer.
+"""
+
+import argparse
+import os
+import queue
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+from profile_scenes import DEFAULT_FILE, QUALITIES as SIZES, load_scene_classes
+from render_sections import DEMO_SCENE, HERE, QUALITIES as FOLDERS, render_section
+
+DEFAULT_OUTPUT_DIR = os.path.join(HERE, "media", "ladder")
+DEFAULT_QUALITIES = ["l", "m", "h"]  # every lesson is published at these three
+DEFAULT_QUEUE_FRAMES = 8  # frames waiting per encoder before rendering pauses
+
+def encoder_command(source, target, path, preset="medium"):
+    """
+    The ffmpeg command that reads raw RGBA frames of size `source` from
+    stdin and writes `path` at size `target`. Both are (height, width, fps).
+    """
+    height, width, fps = source
+    out_height, out_width, out_fps = target
+    filters = []
+    if (out_height, out_width) != (height, width):
+        filters.append(f"scale={out_width}:{out_height}:flags=area")
+    if out_fps != fps:
+        filters.append(f"fps={out_fps}")
+    return (["ffmpeg", "-y", "-loglevel", "error",
+             "-f", "rawvideo", "-pix_fmt", "rgba", "-s", f"{width}x{height}", "-r", str(fps), "-i", "-"]
+            + (["-vf", ",".join(filters)] if filters else [])
+            + ["-c:v", "libx264", "-preset", preset, "-pix_fmt", "yuv420p", "-movflags", "+faststart", path])
+
+class FrameFanout:
+    """
+    Sends every frame to several ffmpeg encoders at once.
+
+    Each encoder has its own thread and a small queue, so the encoders
+    work in parallel with each other and with the renderer. The same
+    bytes object goes into every queue, so a frame is only copied once.
+    If an encoder falls DEFAULT_QUEUE_FRAMES frames behind, write() waits
+    for it instead of piling up frames in memory.
+    """
+
+    def __init__(self, source, outputs, preset="medium", queue_frames=DEFAULT_QUEUE_FRAMES):
+        self.source = source          # (height, width, fps) of the frames written
+        self.outputs = outputs        # {path: (height, width, fps)}
+        self.preset = preset
+        self.queue_frames = queue_frames
+        self.frames = 0
+        self._encoders = []
+
+    def __enter__(self):
+        for path, target in self.outputs.items():
+            os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+            process = subprocess.Popen(encoder_command(self.source, target, path, self.preset),
+                                       stdin=subprocess.PIPE)
+            frames = queue.Queue(self.queue_frames)
+            encoder = {"path": path, "process": process, "queue": frames, "error": None}
+            encoder["thread"] = threading.Thread(target=self._feed, args=(encoder,), daemon=True)
+            encoder["thread"].start()
+            self._encoders.append(encoder)
+        return self
+
+    @staticmethod
+    def _feed(encoder):
+        stdin = encoder["process"].stdin
+        while True:
+            item = encoder["queue"].get()
+            if item is None:
+                break
+            if encoder["error"] is not None:
+                continue  # keep emptying the queue so write() never gets stuck
+            data, count = item
+            try:
+                for _ in range(count):
+                    stdin.write(data)
+            except OSError as error:  # ffmpeg quit early; its exit code says why
+                encoder["error"] = error
+        try:
+            stdin.close()
+        except OSError:
+            pass
+
+    def write(self, frame, count=1):
+        """Send one frame (an RGBA pixel array) to every encoder, `count` times in a row."""
+        data = frame.tobytes()
+        for encoder in self._encoders:
+            encoder["queue"].put((data, count))
+        self.frames += count
+
+    def __exit__(self, *exc_info):
+        for encoder in self._encoders:
+            encoder["queue"].put(None)
+        failed = []
+        for encoder in self._encoders:
+            encoder["thread"].join()
+            if encoder["process"].wait() != 0 or encoder["error"] is not None:
+                failed.append(encoder["path"])
+        if failed and exc_info[0] is None:
+            raise RuntimeError(f"ffmpeg failed to encode {', '.join(failed)}")
+
+def ladder_outputs(scene_name, qualities, output_dir=DEFAULT_OUTPUT_DIR):
+    """{quality: path of its video}, named like render_sections.py names them."""
+    return {quality: os.path.join(output_dir, f"{scene_name}_{FOLDERS[quality]}.mp4")
+            for quality in qualities}
+
+def render_ladder(scene_class, qualities=DEFAULT_QUALITIES, output_dir=DEFAULT_OUTPUT_DIR,
+                  preset="medium", queue_frames=DEFAULT_QUEUE_FRAMES):
+    """
+    Render scene_class once and encode it at every quality at the same time.
+
+    The frames are drawn at the biggest size and the highest frame rate
+    among `qualities`. Returns {quality: path of the finished video}.
+    """
+    from manim import tempconfig
+
+    height = max(SIZES[q][0] for q in qualities)
+    width = max(SIZES[q][1] for q in qualities)
+    fps = max(SIZES[q][2] for q in qualities)
+    outputs = ladder_outputs(scene_class.__name__, qualities, output_dir)
+
+    fanout = FrameFanout((height, width, fps), {outputs[q]: SIZES[q] for q in qualities},
+                         preset, queue_frames)
+
+    class Streaming(scene_class):
+        def setup(self):
+            super().setup()
+            add_frame = self.renderer.add_frame
+
+            # Every frame the renderer makes goes to the encoders
+            # (wait() sends one frame with num_frames > 1)
+            def streaming_add_frame(frame, num_frames=1):
+                if not self.renderer.skip_animations:
+                    fanout.write(frame, num_frames)
+                return add_frame(frame, num_frames)
+
+            self.renderer.add_frame = streaming_add_frame
+
+    Streaming.__name__ = Streaming.__qualname__ = scene_class.__name__
+
+    # manim itself writes no movie: no partial movie files and no concat step
+    with tempfile.TemporaryDirectory(prefix="ladder-") as media_dir:
+        options = {"pixel_height": height, "pixel_width": width, "frame_rate": fps,
+                   "write_to_movie": False, "disable_caching": True, "media_dir": media_dir}
+        with tempconfig(options), fanout:
+            Streaming().render()
+    return outputs
+
+def compare_with_separate_runs(scene_name, qualities, scene_file=DEFAULT_FILE, preset="medium"):
+    """
+    Time one normal manim run per quality against one ladder run.
+
+    Both sides run as fresh processes, so both pay for importing manim.
+    Returns {"separate": {quality: seconds}, "ladder": seconds}.
+    """
+    separate = {}
+    with tempfile.TemporaryDirectory(prefix="compare-") as scratch:
+        for quality in qualities:
+            start = time.perf_counter()
+            render_section(scene_name, quality, os.path.join(scratch, "separate", f"{quality}.mp4"))
+            separate[quality] = time.perf_counter() - start
+            print(f"🎬 manim -q{quality} ({FOLDERS[quality]}): {separate[quality]:.1f}s")
+
+        start = time.perf_counter()
+        subprocess.run([sys.executable, os.path.abspath(__file__), scene_name, "--file", scene_file,
+                        "--quality", *qualities, "--preset", preset,
+                        "--output-dir", os.path.join(scratch, "ladder")],
+                       cwd=HERE, check=True, stdout=subprocess.DEVNULL)
+        ladder = time.perf_counter() - start
+
+    total = sum(separate.values())
+    print(f"\n{'separate runs':>14}: {total:7.1f}s  ({' + '.join(f'{s:.1f}' for s in separate.values())})")
+    print(f"{'one ladder run':>14}: {ladder:7.1f}s  ({total / ladder:.1f}x faster)")
+    return {"separate": separate, "ladder": ladder}
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render a scene once and encode it at several qualities")
+    parser.add_argument("scene", nargs="?", default=DEMO_SCENE, help="scene class name")
+    parser.add_argument("--file", default=DEFAULT_FILE, help="scene file (default: simple_demo.py)")
+    parser.add_argument("--quality", nargs="+", choices=list(SIZES), default=DEFAULT_QUALITIES,
+                        help="manim quality letters (default: l m h)")
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    parser.add_argument("--preset", default="medium", help="x264 preset (faster = bigger files)")
+    parser.add_argument("--queue-frames", type=int, default=DEFAULT_QUEUE_FRAMES,
+                        help="frames each encoder may fall behind")
+    parser.add_argument("--compare", action="store_true",
+                        help="time one manim run per quality against one ladder run (no videos kept)")
+    args = parser.parse_args(argv)
+
+    if args.compare:
+        if os.path.abspath(args.file) != os.path.abspath(DEFAULT_FILE):
+            parser.error("--compare uses render_sections.py, which renders simple_demo.py")
+        compare_with_separate_runs(args.scene, args.quality, args.file, args.preset)
+        return
+
+    start = time.perf_counter()
+    scene_class, = load_scene_classes(args.file, [args.scene])
+    outputs = render_ladder(scene_class, args.quality, args.output_dir, args.preset, args.queue_frames)
+    for quality, path in outputs.items():
+        print(f"✅ {path}")
+    print(f"\n⏱️  Done in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
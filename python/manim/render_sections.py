@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Render SimpleManimDemo one section at a time, in parallel, with a cache.
+
+Every section of the demo is also its own scene (IntroSection,
+ShapesSection, ...). This script renders the sections in separate manim
+processes at the same time, then glues the videos together with ffmpeg.
+Each section's video is saved under a hash of its code, so after editing
+one section only that section is rendered again.
+
+Usage:
+    python render_sections.py                     # low quality
+    python render_sections.py --quality l h       # several qualities at once
+    python render_sections.py --workers 4 --output-dir media/demo
+"""
+
+import argparse
+import ast
+import hashlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEMO_FILE = os.path.join(HERE, "simple_demo.py")
+DEMO_SCENE = "SimpleManimDemo"
+
+DEFAULT_CACHE_DIR = os.path.join(HERE, "media", "section_cache")
+DEFAULT_OUTPUT_DIR = os.path.join(HERE, "media", "demo")
+
+# manim's -q letters and the folder names it renders them into
+QUALITIES = {"l": "480p15", "m": "720p30", "h": "1080p60", "p": "1440p60", "k": "2160p60"}
+
+def read_demo(path=DEMO_FILE):
+    """
+    Split the demo file into the pieces its section hashes are made of.
+
+    Returns (sections, shared, section_code): DEMO_SECTIONS as a dict, the
+    code every section depends on (imports, constants, helper methods),
+    and for each section scene the source of its class and its method.
+    The file is parsed, not imported, so this doesn't need manim.
+    """
+    with open(path, encoding="utf-8") as f:
+        source = f.read()
+    tree = ast.parse(source)
+
+    def code(node):
+        return ast.get_source_segment(source, node)
+
+    sections, shared, classes = None, [], {}
+    for node in tree.body:
+        if isinstance(node, ast.ClassDef):
+            classes[node.name] = node
+        elif isinstance(node, ast.If):
+            continue  # the `if __name__ == "__main__":` instructions
+        elif isinstance(node, ast.Expr) and isinstance(node.value, ast.Constant):
+            continue  # the docstring
+        else:
+            shared.append(code(node))
+            if isinstance(node, ast.Assign) and any(
+                    getattr(target, "id", None) == "DEMO_SECTIONS" for target in node.targets):
+                sections = ast.literal_eval(node.value)
+    if sections is None or DEMO_SCENE not in classes:
+        raise ValueError(f"{path} has no DEMO_SECTIONS or {DEMO_SCENE}")
+
+    methods = {node.name: code(node) for node in classes[DEMO_SCENE].body
+               if isinstance(node, ast.FunctionDef)}
+    section_methods = {method for method, _ in sections.values()}
+    shared += [code for name, code in methods.items()
+               if name not in section_methods and name != "construct"]
+    section_code = {scene: code(classes[scene]) + "\n" + methods[method]
+                    for scene, (method, _) in sections.items()}
+    return sections, "\n".join(shared), section_code
+
+def helper_sources(path=DEMO_FILE):
+    """Source of the modules next to the demo file that it imports (like patterns.py)."""
+    directory = os.path.dirname(path)
+    with open(path, encoding="utf-8") as f:
+        tree = ast.parse(f.read())
+    names = set()
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Import):
+            names.update(alias.name for alias in node.names)
+        elif isinstance(node, ast.ImportFrom) and node.module and not node.level:
+            names.add(node.module)
+    sources = []
+    for name in sorted(names):
+        helper = os.path.join(directory, name.split(".")[0] + ".py")
+        if os.path.exists(helper):
+            with open(helper, encoding="utf-8") as f:
+                sources.append(name + "\n" + f.read())
+    return "\n".join(sources)
+
+def manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def section_hashes(quality, path=DEMO_FILE):
+    """{scene name: hash of everything that decides how its video looks}."""
+    sections, shared, section_code = read_demo(path)
+    common = hashlib.sha256()
+    for part in (manim_version(), quality, shared, helper_sources(path)):
+        common.update(part.encode("utf-8") + b"\0")
+    hashes = {}
+    for scene in sections:
+        digest = common.copy()
+        digest.update(section_code[scene].encode("utf-8"))
+        hashes[scene] = digest.hexdigest()[:16]
+    return hashes
+
+def cache_path(cache_dir, quality, scene, digest):
+    return os.path.join(cache_dir, QUALITIES[quality], f"{scene}-{digest}.mp4")
+
+def render_section(scene, quality, destination):
+    """Render one section scene in its own manim process and save the video at `destination`."""
+    with tempfile.TemporaryDirectory(prefix=f"{scene}-") as media_dir:
+        subprocess.run(
+            [sys.executable, "-m", "manim", "render", "-q", quality, "--media_dir", media_dir,
+             "--progress_bar", "none", "-v", "WARNING", DEMO_FILE, scene],
+            cwd=HERE, check=True)
+        videos = [os.path.join(root, name)
+                  for root, _, names in os.walk(media_dir)
+                  if "partial_movie_files" not in root
+                  for name in names if name.endswith(".mp4")]
+        if len(videos) != 1:
+            raise RuntimeError(f"Expected one video from {scene}, found {len(videos)}")
+        os.makedirs(os.path.dirname(destination), exist_ok=True)
+        # Copy under a temporary name first, so the cache never has half a video
+        temporary = f"{destination}.{os.getpid()}.tmp"
+        shutil.copyfile(videos[0], temporary)
+        os.replace(temporary, destination)
+
+def concatenate(videos, output):
+    """Glue videos with the same size and frame rate together, without re-encoding."""
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as listing:
+        for video in videos:
+            path = os.path.abspath(video).replace("'", "'\\''")
+            listing.write(f"file '{path}'\n")
+    try:
+        subprocess.run(["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0",
+                        "-i", listing.name, "-c", "copy", output], check=True)
+    finally:
+        os.remove(listing.name)
+
+def render_demo(qualities=("l",), workers=None, cache_dir=DEFAULT_CACHE_DIR,
+                output_dir=DEFAULT_OUTPUT_DIR, progress=print):
+    """
+    Render the whole demo at every quality, re-rendering only changed sections.
+
+    Returns {quality: path of the finished video}.
+    """
+    plans = {}   # quality -> list of section videos, in order
+    jobs = []    # (scene, quality, video) still to render
+    for quality in qualities:
+        plans[quality] = []
+        for scene, digest in section_hashes(quality).items():
+            video = cache_path(cache_dir, quality, scene, digest)
+            plans[quality].append(video)
+            if os.path.exists(video):
+                progress(f"♻️  {scene} ({QUALITIES[quality]}) is cached")
+            else:
+                jobs.append((scene, quality, video))
+
+    def run(job):
+        scene, quality, video = job
+        start = time.perf_counter()
+        render_section(scene, quality, video)
+        progress(f"🎬 {scene} ({QUALITIES[quality]}) rendered in {time.perf_counter() - start:.1f}s")
+
+    if jobs:
+        # Each job is its own manim process; the threads just wait for them
+        with ThreadPoolExecutor(workers or os.cpu_count() or 1) as pool:
+            list(pool.map(run, jobs))
+
+    outputs = {}
+    for quality, videos in plans.items():
+        outputs[quality] = os.path.join(output_dir, f"{DEMO_SCENE}_{QUALITIES[quality]}.mp4")
+        concatenate(videos, outputs[quality])
+        progress(f"✅ {outputs[quality]}")
+    return outputs
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render SimpleManimDemo section by section")
+    parser.add_argument("--quality", nargs="+", choices=list(QUALITIES), default=["l"],
+                        help="manim quality letters (default: l)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="sections rendered at once (default: one per core)")
+    parser.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR)
+    parser.add_argument("--output-dir", default=DEFAULT_OUTPUT_DIR)
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    render_demo(args.quality, args.workers, args.cache_dir, args.output_dir)
+    print(f"\n⏱️  Done in {time.perf_counter() - start:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -6,6 +6,21 @@ This file shows cool animations that work without LaTeX installation.
 
 from manim import *
 
+from patterns import flower_pattern, spiral_dots
+from text_cache import cached_text
+
+# The demo's sections, in order: scene name -> (method that plays it,
+# clear the screen afterwards?). Each section is also its own scene below,
+# so render_sections.py can render them separately and glue them together.
+DEMO_SECTIONS = {
+    "IntroSection": ("show_intro", False),
+    "ShapesSection": ("show_mathematical_shapes", True),
+    "TransformationsSection": ("show_animated_transformations", True),
+    "PatternsSection": ("show_geometric_patterns", True),
+    "ConceptsSection": ("show_interactive_concepts", False),
+    "FinalSection": ("show_final_message", False),
+}
+
 class SimpleManimDemo(Scene):
     """
     A simple Manim demo that works without LaTeX!
@@ -18,11 +33,25 @@ class SimpleManimDemo(Scene):
     """
     
     def construct(self):
+        for scene_name in DEMO_SECTIONS:
+            self.play_section(scene_name)
+
+    def play_section(self, scene_name):
+        """Play one section of the demo, then clear the screen if it should be."""
+        method, clear_after = DEMO_SECTIONS[scene_name]
+        getattr(self, method)()
+        if clear_after:
+            # Clear screen completely between sections
+            self.clear()
+            self.wait(0.5)
+
+    def show_intro(self):
+        """Show the title and subtitle."""
         # Title
-        title = Text("🎨 Simple Manim Animations!", 
-                    font_size=36, color=BLUE)
-        subtitle = Text("No LaTeX Required!", 
-                       font_size=24, color=GREEN)
+        title = cached_text("🎨 Simple Manim Animations!", 
+                           font_size=36, color=BLUE)
+        subtitle = cached_text("No LaTeX Required!", 
+                              font_size=24, color=GREEN)
         
         # Show title first
         self.play(Write(title))
@@ -37,38 +66,11 @@ class SimpleManimDemo(Scene):
         # Clear subtitle completely
         self.play(FadeOut(subtitle))
         self.wait(0.5)  # Ensure clearing is complete
-        
-        # 1. Beautiful Mathematical Shapes
-        self.show_mathematical_shapes()
-        
-        # Clear screen completely between sections
-        self.clear()
-        self.wait(0.5)
-        
-        # 2. Animated Transformations
-        self.show_animated_transformations()
-        
-        # Clear screen completely between sections
-        self.clear()
-        self.wait(0.5)
-        
-        # 3. Geometric Patterns
-        self.show_geometric_patterns()
-        
-        # Clear screen completely between sections
-        self.clear()
-        self.wait(0.5)
-        
-        # 4. Interactive Concepts
-        self.show_interactive_concepts()
-        
-        # Final message
-        self.show_final_message()
-    
+
     def show_mathematical_shapes(self):
         """Show beautiful mathematical shapes with animations."""
-        title = Text("1. Beautiful Mathematical Shapes", 
-                    font_size=28, color=YELLOW)
+        title = cached_text("1. Beautiful Mathematical Shapes", 
+                           font_size=28, color=YELLOW)
         self.play(Write(title))
         self.wait(1)
         
@@ -103,8 +105,8 @@ class SimpleManimDemo(Scene):
     
     def show_animated_transformations(self):
         """Show cool transformations and movements."""
-        title = Text("2. Animated Transformations", 
-                    font_size=28, color=ORANGE)
+        title = cached_text("2. Animated Transformations", 
+                           font_size=28, color=ORANGE)
         self.play(Write(title))
         self.wait(1)
         
@@ -149,8 +151,8 @@ class SimpleManimDemo(Scene):
     
     def show_geometric_patterns(self):
         """Show beautiful geometric patterns."""
-        title = Text("3. Geometric Patterns", 
-                    font_size=28, color=BLUE)
+        title = cached_text("3. Geometric Patterns", 
+                           font_size=28, color=BLUE)
         self.play(Write(title))
         self.wait(1)
         
@@ -158,20 +160,8 @@ class SimpleManimDemo(Scene):
         self.play(FadeOut(title))
         self.wait(0.5)
         
-        # Create a spiral pattern
-        dots = VGroup()
-        for i in range(50):
-            angle = i * 0.5
-            radius = i * 0.1
-            x = radius * np.cos(angle)
-            y = radius * np.sin(angle)
-            # Use simple color interpolation
-            if i < 25:
-                color = interpolate_color(RED, BLUE, i/25)
-            else:
-                color = interpolate_color(BLUE, RED, (i-25)/25)
-            dot = Dot([x, y, 0], color=color)
-            dots.add(dot)
+        # Create a spiral pattern (patterns.py works out all 50 dots at once)
+        dots = spiral_dots(50)
         
         self.play(Create(dots), run_time=3)
         self.wait(0.5)
@@ -181,12 +171,7 @@ class SimpleManimDemo(Scene):
         self.wait(0.5)
         
         # Create a flower pattern
-        flower = VGroup()
-        for i in range(12):
-            color = interpolate_color(PINK, PURPLE, i/12)
-            petal = Ellipse(width=0.5, height=2, color=color)
-            petal.rotate(i * PI/6)
-            flower.add(petal)
+        flower = flower_pattern(12)
         
         self.play(Create(flower))
         self.wait(0.5)
@@ -201,8 +186,8 @@ class SimpleManimDemo(Scene):
     
     def show_interactive_concepts(self):
         """Show interactive mathematical concepts."""
-        title = Text("4. Interactive Mathematical Concepts", 
-                    font_size=28, color=GOLD)
+        title = cached_text("4. Interactive Mathematical Concepts", 
+                           font_size=28, color=GOLD)
         self.play(Write(title))
         self.wait(1)
         
@@ -211,7 +196,7 @@ class SimpleManimDemo(Scene):
         self.wait(0.5)
         
         # Create a clear fraction visualization
-        fraction_text = Text("3/4", font_size=48, color=YELLOW)
+        fraction_text = cached_text("3/4", font_size=48, color=YELLOW)
         self.play(Write(fraction_text))
         self.wait(0.5)
         
@@ -250,8 +235,8 @@ class SimpleManimDemo(Scene):
         self.play(Create(highlight))
         
         # Add explanatory text
-        explanation = Text("3 out of 4 parts highlighted", 
-                          font_size=24, color=WHITE)
+        explanation = cached_text("3 out of 4 parts highlighted", 
+                                 font_size=24, color=WHITE)
         explanation.next_to(rectangle, DOWN, buff=0.5)
         self.play(Write(explanation))
         
@@ -264,12 +249,12 @@ class SimpleManimDemo(Scene):
     
     def show_final_message(self):
         """Show final inspiring message."""
-        message1 = Text("🎉 You can create ALL of this with Manim!", 
-                       font_size=32, color=GREEN)
-        message2 = Text("Start with simple shapes, then build up to complex animations!", 
-                       font_size=24, color=BLUE)
-        message3 = Text("Ready to start your mathematical animation journey?", 
-                       font_size=28, color=YELLOW)
+        message1 = cached_text("🎉 You can create ALL of this with Manim!", 
+                              font_size=32, color=GREEN)
+        message2 = cached_text("Start with simple shapes, then build up to complex animations!", 
+                              font_size=24, color=BLUE)
+        message3 = cached_text("Ready to start your mathematical animation journey?", 
+                              font_size=28, color=YELLOW)
         
         # Show first message
         self.play(Write(message1))
@@ -298,6 +283,34 @@ class SimpleManimDemo(Scene):
         self.play(FadeOut(message3))
         self.wait(1)
 
+# ============================================================================
+# EACH SECTION AS ITS OWN SCENE (see render_sections.py)
+# ============================================================================
+
+class IntroSection(SimpleManimDemo):
+    def construct(self):
+        self.play_section("IntroSection")
+
+class ShapesSection(SimpleManimDemo):
+    def construct(self):
+        self.play_section("ShapesSection")
+
+class TransformationsSection(SimpleManimDemo):
+    def construct(self):
+        self.play_section("TransformationsSection")
+
+class PatternsSection(SimpleManimDemo):
+    def construct(self):
+        self.play_section("PatternsSection")
+
+class ConceptsSection(SimpleManimDemo):
+    def construct(self):
+        self.play_section("ConceptsSection")
+
+class FinalSection(SimpleManimDemo):
+    def construct(self):
+        self.play_section("FinalSection")
+
 # ============================================================================
 # HOW TO RUN THIS DEMO
 # ============================================================================
@@ -317,5 +330,11 @@ if __name__ == "__main__":
     print("  -q: Medium quality (faster rendering)")
     print("  -l: Use a lower resolution")
     print()
+    print("To render only what changed, every section at once:")
+    print("   python render_sections.py --quality l h")
+    print()
+    print("To render it once and get low, medium and high quality videos:")
+    print("   python quality_ladder.py --quality l m h")
+    print()
     print("🚀 Get ready to be amazed by mathematical animations!")
     print("💡 You'll learn to create these step by step in future lessons!")
@@ -0,0 +1,182 @@
+#!/usr/bin/env python3
+"""
+Build each Text only once - even across scenes and runs!
+
+Making a Text means asking Pango to draw the letters into an SVG file and
+then turning every letter's outline into Bezier curves. The same titles
+show up again and again (every render of every section), so this saves
+the finished curves and colors to disk and loads them next time.
+
+Usage:
+    from text_cache import cached_text
+
+    title = cached_text("1. Beautiful Mathematical Shapes", font_size=28, color=YELLOW)
+    self.play(Write(title))
+
+cached_text takes the same arguments as Text and returns a VGroup with
+one VMobject per letter, just like Text has, so Write, FadeOut, scale,
+set_color and next_to all work the same way.
+"""
+
+import hashlib
+import json
+import os
+from importlib import metadata
+
+import numpy as np
+from manim import *
+
+HERE = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_CACHE_DIR = os.path.join(HERE, "media", "text_cache")
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024  # on disk; the oldest-used files go first
+DEFAULT_MEMORY_ITEMS = 256            # texts kept in memory in this process
+
+class CachedText(VGroup):
+    """The letters of a cached Text. `text` is the string it shows."""
+
+    def __init__(self, text, *letters, **kwargs):
+        super().__init__(*letters, **kwargs)
+        self.text = text
+
+def _manim_version():
+    try:
+        return metadata.version("manim")
+    except metadata.PackageNotFoundError:
+        return "unknown"
+
+def text_key(text, **kwargs):
+    """A file-name-safe hash of everything that decides how the Text looks."""
+    settings = {"text": text, "manim": _manim_version(), **kwargs}
+    blob = json.dumps(settings, sort_keys=True, default=str)
+    return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:32]
+
+def _pack(mobject):
+    """The points and colors of every letter, as a dict of NumPy arrays."""
+    letters = [part for part in mobject.family_members_with_points() if isinstance(part, VMobject)]
+
+    def rows(name):
+        arrays = [np.asarray(getattr(part, name), dtype=float).reshape(-1, 4) for part in letters]
+        return np.concatenate(arrays) if arrays else np.zeros((0, 4)), [len(a) for a in arrays]
+
+    fill, fill_counts = rows("fill_rgbas")
+    stroke, stroke_counts = rows("stroke_rgbas")
+    return {
+        "points": np.concatenate([part.points for part in letters]) if letters else np.zeros((0, 3)),
+        "point_counts": np.array([len(part.points) for part in letters], dtype=np.int64),
+        "fill": fill,
+        "fill_counts": np.array(fill_counts, dtype=np.int64),
+        "stroke": stroke,
+        "stroke_counts": np.array(stroke_counts, dtype=np.int64),
+        "stroke_width": np.array([part.stroke_width for part in letters], dtype=float),
+    }
+
+def _unpack(text, arrays):
+    """Turn arrays from _pack back into a CachedText."""
+    points = np.split(arrays["points"], np.cumsum(arrays["point_counts"])[:-1])
+    fills = np.split(arrays["fill"], np.cumsum(arrays["fill_counts"])[:-1])
+    strokes = np.split(arrays["stroke"], np.cumsum(arrays["stroke_counts"])[:-1])
+    letters = []
+    for letter_points, fill, stroke, width in zip(points, fills, strokes, arrays["stroke_width"]):
+        letter = VMobject()
+        letter.set_points(letter_points)
+        letter.fill_rgbas = fill.copy()
+        letter.stroke_rgbas = stroke.copy()
+        letter.stroke_width = float(width)
+        letters.append(letter)
+    return CachedText(text, *letters)
+
+class TextCache:
+    """
+    Text mobjects saved on disk (and remembered in memory) by their settings.
+
+    The disk part is shared by every scene, process and run that uses the
+    same folder. When its files add up to more than `max_bytes`, the ones
+    used longest ago are deleted. hits, disk_hits and misses count where
+    answers came from.
+    """
+
+    def __init__(self, directory=DEFAULT_CACHE_DIR, max_bytes=DEFAULT_MAX_BYTES,
+                 memory_items=DEFAULT_MEMORY_ITEMS):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory_items = memory_items
+        self._memory = {}
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    def text(self, text, **kwargs):
+        """Like Text(text, **kwargs), but built at most once per cache folder."""
+        key = text_key(text, **kwargs)
+        if key in self._memory:
+            self.hits += 1
+            return self._memory[key].copy()
+
+        path = self._path(key)
+        try:
+            with np.load(path) as data:
+                mobject = _unpack(text, {name: data[name] for name in data.files})
+            os.utime(path)  # mark it as recently used
+            self.disk_hits += 1
+        except (OSError, ValueError, KeyError):
+            arrays = _pack(Text(text, **kwargs))
+            self._save(path, arrays)
+            mobject = _unpack(text, arrays)
+            self.misses += 1
+
+        if len(self._memory) >= self.memory_items:
+            self._memory.pop(next(iter(self._memory)))
+        self._memory[key] = mobject
+        return mobject.copy()
+
+    def _save(self, path, arrays):
+        os.makedirs(self.directory, exist_ok=True)
+        # Write under a temporary name first, so nobody reads half a file
+        temporary = f"{path}.{os.getpid()}.tmp.npz"
+        np.savez(temporary, **arrays)
+        os.replace(temporary, path)
+        self.evict()
+
+    def evict(self):
+        """Delete the least recently used files until the folder fits in max_bytes."""
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(".npz") or ".tmp" in name:
+                continue
+            try:
+                info = os.stat(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                continue  # another process just removed it
+            entries.append((info.st_mtime, info.st_size, name))
+        total = sum(size for _, size, _ in entries)
+        for _, size, name in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(os.path.join(self.directory, name))
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def stats(self):
+        return {"hits": self.hits, "disk_hits": self.disk_hits, "misses": self.misses}
+
+    def clear(self):
+        """Forget everything, in memory and on disk."""
+        self._memory.clear()
+        if os.path.isdir(self.directory):
+            for name in os.listdir(self.directory):
+                if name.endswith(".npz"):
+                    os.remove(os.path.join(self.directory, name))
+
+_default_cache = None
+
+def cached_text(text, **kwargs):
+    """Text(text, **kwargs) through the shared cache in media/text_cache."""
+    global _default_cache
+    if _default_cache is None:
+        _default_cache = TextCache()
+    return _default_cache.text(text, **kwargs)
@@ -0,0 +1,23 @@
+import pytest
+
+from lesson1_factorize import main
+
+def test_cli_explains_gcd_and_lcm(capsys):
+    main(["48", "18"])
+    assert capsys.readouterr().out.splitlines() == [
+        "48 = 2^4 × 3",
+        "18 = 2 × 3^2",
+        "GCD = 2 × 3 = 6  (smallest power of each shared prime)",
+        "LCM = 2^4 × 3^2 = 144  (biggest power of every prime)",
+    ]
+
+@pytest.mark.parametrize("argv, message", [
+    (["0", "5"], "need a positive whole number, got 0"),
+    (["48", "-3"], "need a positive whole number, got -3"),
+    (["forty"], "'forty' is not a whole number"),
+])
+def test_cli_rejects_numbers_without_prime_factors(argv, message, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(argv)
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
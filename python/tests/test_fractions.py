@@ -0,0 +1,15 @@
+from fractions import Fraction
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from lesson1_fractions import FractionArray
+
+@pytest.mark.parametrize("numerators, denominators", [([1, 2**63], [3, 5]), ([-4, 2**63], [6, 2**62])])
+def test_uint64_range_numbers_stay_exact(numerators, denominators):
+    fractions = FractionArray(numerators, denominators)
+    expected = [Fraction(n, d) for n, d in zip(numerators, denominators)]
+    assert fractions.to_fractions() == expected
+    doubled = fractions + fractions
+    assert doubled.to_fractions() == [2 * f for f in expected]
@@ -0,0 +1,43 @@
+import math
+
+import pytest
+
+np = pytest.importorskip("numpy")
+
+from lesson1_gcd_lcm import as_int_array, find_gcd_batch, find_gcd_lcm_batch, find_lcm, find_lcm_batch
+
+def test_as_int_array_never_goes_through_floats():
+    assert as_int_array([1, 2**63]).dtype == np.uint64
+    assert as_int_array([-1, 2**63]).dtype == object
+    assert as_int_array([[1, 2**63], [3, 4]]).dtype == np.uint64
+    assert as_int_array([1.5, 2]).dtype == np.float64
+
+@pytest.mark.parametrize("a, b", [([1, 2**63], [4, 6]), ([-1, 2**63], [3, 6]), ([2**63 + 3, -5], [9, 10])])
+def test_batch_accepts_mixed_uint64_range_lists(a, b):
+    gcds = [math.gcd(x, y) for x, y in zip(a, b)]
+    lcms = [abs(x * y) // g for x, y, g in zip(a, b, gcds)]
+    assert find_gcd_batch(a, b).tolist() == gcds
+    assert find_lcm_batch(a, b, on_overflow="object").tolist() == lcms
+    both = find_gcd_lcm_batch(a, b, on_overflow="object")
+    assert [part.tolist() for part in both] == [gcds, lcms]
+
+def test_batch_still_rejects_floats():
+    with pytest.raises(TypeError):
+        find_gcd_batch([1.5, 2], [3, 4])
+
+@pytest.mark.parametrize("a, b", [(4, 6), (0, 5)])
+def test_find_lcm_checks_options_before_anything_else(a, b):
+    with pytest.raises(ValueError, match="on_overflow"):
+        find_lcm(a, b, on_overflow="wrap")
+    with pytest.raises(ValueError, match="on_overflow"):
+        find_lcm(a, b, limit=100, on_overflow="wrap")
+    with pytest.raises(ValueError, match="negative"):
+        find_lcm(a, b, limit=-1)
+    with pytest.raises(ValueError, match="negative"):
+        find_lcm_batch([a], [b], limit=-1)
+
+def test_find_lcm_limit():
+    assert find_lcm(4, 6, limit=12) == 12
+    assert find_lcm(4, 6, limit=11, on_overflow="saturate") == 11
+    with pytest.raises(OverflowError):
+        find_lcm(4, 6, limit=11)
@@ -0,0 +1,19 @@
+import math
+from collections import Counter
+from itertools import combinations
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from lesson1_gcd_matrix import count_pairs_by_gcd, gcd_matrix
+
+VALUES = [1, 2**63, 6, 2**63 + 2, 12]
+
+def test_gcd_matrix_with_uint64_range_value():
+    assert gcd_matrix(VALUES).tolist() == [[math.gcd(x, y) for y in VALUES] for x in VALUES]
+
+@pytest.mark.parametrize("method", ["auto", "pairs"])
+def test_count_pairs_with_uint64_range_value(method):
+    expected = Counter(math.gcd(x, y) for x, y in combinations(VALUES, 2))
+    assert count_pairs_by_gcd(VALUES, method=method) == dict(expected)
@@ -0,0 +1,19 @@
+import io
+
+import pytest
+
+from lesson1_gcd_pipeline import parse_pair, run_parallel
+
+def test_parse_pair_error_is_neutral():
+    with pytest.raises(ValueError) as error:
+        parse_pair("48")
+    assert str(error.value) == "Expected two numbers per line, got '48'"
+
+def test_parallel_points_to_stream_for_split_pairs():
+    with pytest.raises(ValueError, match="`stream` accepts pairs split across lines"):
+        run_parallel(io.StringIO("48 18\n12\n8\n"), io.StringIO(), workers=1)
+
+def test_parallel_keeps_other_errors_as_they_are():
+    with pytest.raises(ValueError) as error:
+        run_parallel(io.StringIO("48 18\nx 8\n"), io.StringIO(), workers=1)
+    assert "stream" not in str(error.value)
@@ -0,0 +1,51 @@
+import asyncio
+import math
+
+import lesson1_gcd_lcm
+from lesson1_gcd_server import VECTORIZE_MIN_BATCH, BatchingGCDServer, compute_batch
+
+def _batch_with_big_pair():
+    pairs = [(12 * k, 18 * k + 6) for k in range(1, VECTORIZE_MIN_BATCH + 8)]
+    pairs[5] = (1, 9223372036854775808)  # 2**63, one past the int64 range
+    return pairs
+
+def _expected(pairs):
+    return [(math.gcd(a, b), abs(a * b) // math.gcd(a, b)) for a, b in pairs]
+
+def test_batch_with_uint64_range_pair():
+    pairs = _batch_with_big_pair()
+    assert compute_batch(pairs) == _expected(pairs)
+
+def test_batch_falls_back_when_numpy_refuses(monkeypatch):
+    def refuse(*args, **kwargs):
+        raise TypeError("numbers this big need an object array")
+
+    monkeypatch.setattr(lesson1_gcd_lcm, "find_gcd_lcm_batch", refuse)
+    pairs = _batch_with_big_pair()
+    assert compute_batch(pairs) == _expected(pairs)
+
+def test_server_answers_every_client_in_a_shared_batch():
+    pairs = _batch_with_big_pair()
+
+    async def run():
+        server = BatchingGCDServer(max_batch=len(pairs), max_delay=1.0)
+        listener = await server.start(port=0)
+        port = listener.sockets[0].getsockname()[1]
+
+        async def ask(a, b):
+            reader, writer = await asyncio.open_connection("127.0.0.1", port)
+            writer.write(f"{a} {b}\n".encode())
+            await writer.drain()
+            line = await reader.readline()
+            writer.close()
+            return line.decode().strip()
+
+        try:
+            return await asyncio.gather(*(ask(a, b) for a, b in pairs)), server.batches
+        finally:
+            listener.close()
+            await server.stop()
+
+    lines, batches = asyncio.run(run())
+    assert lines == [f"{a},{b},{g},{lcm}" for (a, b), (g, lcm) in zip(pairs, _expected(pairs))]
+    assert batches == 1
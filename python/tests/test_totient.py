@@ -0,0 +1,28 @@
+import math
+
+import pytest
+
+pytest.importorskip("numpy")
+
+from lesson1_totient import TotientSieve, main
+
+def test_gcd_counts_matches_the_docstring():
+    assert TotientSieve.build(10).gcd_counts(6) == {1: 2, 2: 2, 3: 1, 6: 1}
+    assert [math.gcd(k, 6) for k in range(1, 7)] == [1, 2, 3, 2, 1, 6]
+
+@pytest.mark.parametrize("argv, message", [
+    (["0"], "need a positive whole number, got 0"),
+    (["-3"], "need a positive whole number, got -3"),
+    (["12", "--with-gcd", "5"], "--with-gcd 5 does not divide 12"),
+    (["12", "--with-gcd", "0"], "need a positive whole number, got 0"),
+    (["12", "--limit", "0"], "need a positive whole number, got 0"),
+])
+def test_cli_rejects_bad_numbers(argv, message, capsys):
+    with pytest.raises(SystemExit) as exit_info:
+        main(argv)
+    assert exit_info.value.code == 2
+    assert message in capsys.readouterr().err
+
+def test_cli_lists_numbers_with_gcd(capsys):
+    main(["12", "--with-gcd", "4", "--limit", "100"])
+    assert capsys.readouterr().out.splitlines()[-1] == "4 8"